@@ -1,7 +1,9 @@
 #!/usr/bin/env uv run
 # /// script
 # requires-python = ">=3.12"
-# dependencies = []
+# dependencies = [
+#     "numpy>=1.26",
+# ]
 # ///
 """
 Offline chunking CLI.
@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import sys
 from pathlib import Path
 
@@ -97,6 +98,12 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Reformulations per family (default: from config or 10)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="Worker processes for document generation (1 runs serially)",
+    )
     parser.add_argument(
         "--verbose",
         "-v",
@@ -175,6 +182,7 @@ def main() -> int:
         num_docs=args.num_docs,
         domains=domains,
         size_range=(args.min_size, args.max_size),
+        workers=args.workers,
     )
 
     # Write documents to corpus directory
@@ -28,6 +28,7 @@ import argparse
 import hashlib
 import json
 import logging
+import os
 import re
 import subprocess
 import sys
@@ -227,6 +228,7 @@ def run_experiment(
             num_docs=20,  # Small corpus for v0.1
             domains=["text", "code", "json", "logs"],
             size_range=(1024, 8192),
+            workers=os.cpu_count(),
         )
         documents = [
             {
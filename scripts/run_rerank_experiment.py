@@ -36,6 +36,7 @@ import argparse
 import hashlib
 import json
 import logging
+import os
 import random
 import subprocess
 import sys
@@ -257,6 +258,7 @@ def run_rerank_experiment(
         num_docs=num_docs,
         domains=["text", "code", "json", "logs"],
         size_range=(2048, 8192),
+        workers=os.cpu_count(),
     )
 
     # Initialize components
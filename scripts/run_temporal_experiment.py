@@ -31,6 +31,7 @@ import argparse
 import hashlib
 import json
 import logging
+import os
 import random
 import subprocess
 import sys
@@ -266,6 +267,7 @@ def generate_temporal_corpus(
         num_docs=num_docs,
         domains=["text", "code", "json", "logs"],
         size_range=(2048, 8192),
+        workers=os.cpu_count(),
     )
 
     temporal_docs = []
@@ -11,17 +11,24 @@ Test runner for curv-embedding.
 
 Runs all unit tests and validates module functionality.
 
+Tests run in parallel worker processes by default; use --serial to run
+them one at a time in this process (easier for debugging tracebacks).
+
 Usage:
     uv run scripts/test_all.py
     uv run scripts/test_all.py --verbose
+    uv run scripts/test_all.py --serial
 """
 
 from __future__ import annotations
 
 import argparse
+import os
 import sys
 import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
+from typing import Callable
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -47,6 +54,17 @@ def test_config() -> tuple[bool, str]:
     config2 = Config.from_dict(d)
     assert config2.config_hash() == h
 
+    # Default hash is pinned: recorded runs must keep reproducing
+    assert h == "c13896b23c90b99d"
+
+    # Non-default embedding inference options are part of the config hash;
+    # the local ONNX cache directory never is
+    assert config.embedding.precision == "fp32"
+    onnx = Config.from_dict({"embedding": {"backend": "onnx", "quantization": "avx2"}})
+    assert onnx.config_hash() != h
+    moved = Config.from_dict({"embedding": {"cache_dir": "/tmp/onnx"}})
+    assert moved.config_hash() == h
+
     return True, "config module OK"
 
 
@@ -55,6 +73,7 @@ def test_cut_score() -> tuple[bool, str]:
     from src.chunking.cut_score import (
         CutScoreSignals,
         compute_cut_score,
+        make_scorer,
         RollingNormalizer,
         relu,
         SignalNormalizers,
@@ -86,6 +105,12 @@ def test_cut_score() -> tuple[bool, str]:
     assert isinstance(score, float)
     assert score >= 0.0
 
+    # make_scorer matches the reference formula, including non-finite settings
+    inf_config = ChunkingConfig(s0=float("inf"))
+    _, raw = compute_cut_score(signals, inf_config)
+    assert make_scorer(inf_config)(raw) == compute_cut_score(signals, inf_config)[0]
+    assert make_scorer(config)(norm_signals) == score
+
     return True, "cut_score module OK"
 
 
@@ -146,6 +171,40 @@ def test_streaming_chunking() -> tuple[bool, str]:
             pass
     final_chunks = chunker.finalize()
 
+    # Gear curvature proxy: covers the input and is deterministic
+    gear_config = ChunkingConfig(
+        min_bytes=10,
+        max_bytes=100,
+        commit_horizon_bytes=50,
+        overlap_bytes=0,
+    )
+    gear_data = data * 8
+
+    def gear_iter():
+        for i in range(0, len(gear_data), 20):
+            yield gear_data[i:i + 20]
+
+    gear_chunks = list(chunk_stream(gear_iter(), gear_config, curvature_proxy="gear"))
+    assert len(gear_chunks) > 1
+    assert b"".join(c.content for c in gear_chunks) == gear_data
+    assert gear_chunks[0].byte_start == 0
+    assert gear_chunks[-1].byte_end == len(gear_data)
+    assert all(a.byte_end == b.byte_start for a, b in zip(gear_chunks, gear_chunks[1:]))
+    repeat = list(chunk_stream(gear_iter(), gear_config, curvature_proxy="gear"))
+    assert [c.byte_end for c in repeat] == [c.byte_end for c in gear_chunks]
+
+    # Unknown proxy names are rejected
+    for make in (
+        lambda: list(chunk_stream(gear_iter(), gear_config, curvature_proxy="bogus")),
+        lambda: StreamingChunker(gear_config, curvature_proxy="bogus"),
+    ):
+        try:
+            make()
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("unknown curvature proxy accepted")
+
     return True, "streaming chunking OK"
 
 
@@ -182,7 +241,17 @@ def test_data_generator() -> tuple[bool, str]:
 
 def test_manifests() -> tuple[bool, str]:
     """Test manifest generation."""
-    from src.chunking.manifests import generate_manifest, validate_manifest
+    import io
+    import json
+    from dataclasses import replace
+
+    from src.chunking.manifests import (
+        generate_manifest,
+        manifest_to_json,
+        validate_manifest,
+        verify_chunk_integrity,
+        write_manifest,
+    )
     from src.chunking.offline import chunk_offline
     from src.config import Config, ChunkingConfig
 
@@ -202,6 +271,35 @@ def test_manifests() -> tuple[bool, str]:
     is_valid, issues = validate_manifest(manifest)
     assert is_valid, f"Manifest validation failed: {issues}"
 
+    # Merkle root covers chunk contents
+    assert "merkle_root" in manifest
+    is_valid, issues = verify_chunk_integrity(manifest, chunks, merkle_only=True)
+    assert is_valid, f"Merkle verification failed: {issues}"
+
+    # Right content at shifted offsets still fails the Merkle check
+    shifted = [replace(c, byte_start=c.byte_start + 1) for c in chunks]
+    is_valid, issues = verify_chunk_integrity(manifest, shifted, merkle_only=True)
+    assert not is_valid and "byte_start mismatch" in issues[0]
+
+    # write_manifest streams the same document as generate_manifest
+    multi_chunks = chunk_offline(
+        data + b"\n" + data * 10,
+        ChunkingConfig(min_bytes=10, max_bytes=100, overlap_bytes=0),
+    )
+    assert len(multi_chunks) > 1
+    for doc_id, doc_chunks in (
+        ("test_doc", multi_chunks),
+        ("empty_doc", []),
+        ("doc_\u00e9\u4e2d", chunks),
+    ):
+        buf = io.StringIO()
+        write_manifest(buf, doc_chunks, doc_id, config)
+        written = json.loads(buf.getvalue())
+        expected = generate_manifest(doc_chunks, doc_id, config)
+        expected["created_at"] = written["created_at"]
+        assert written == expected
+        assert buf.getvalue() == manifest_to_json(expected)
+
     return True, "manifests OK"
 
 
@@ -213,7 +311,13 @@ def test_vectors() -> tuple[bool, str]:
         l2_distance,
         normalize_vectors,
         vectors_to_bytes,
+        vectors_to_memoryview,
         bytes_to_vectors,
+        quantize_int8,
+        dequantize_int8,
+        cosine_similarity_int8,
+        vectors_to_bytes_int8,
+        bytes_to_vectors_int8,
     )
 
     # Test cosine similarity
@@ -238,6 +342,22 @@ def test_vectors() -> tuple[bool, str]:
     data = vectors_to_bytes(vectors)
     recovered = bytes_to_vectors(data, 384)
     assert np.allclose(vectors, recovered)
+    assert bytes(vectors_to_memoryview(vectors)) == data
+    assert bytes(vectors_to_memoryview(np.asfortranarray(vectors, np.float64))) == data
+    writable = bytes_to_vectors(data, 384, writable=True)
+    writable /= 2
+    assert np.array_equal(recovered, vectors) and writable.flags.writeable
+
+    # Test int8 quantization
+    q, scales = quantize_int8(vectors)
+    assert q.dtype == np.int8 and scales.shape == (10,)
+    assert np.all(np.abs(dequantize_int8(q, scales) - vectors) <= scales[:, None])
+    assert abs(cosine_similarity_int8(q[0], q[0]) - 1.0) < 1e-6
+    assert abs(
+        cosine_similarity_int8(q[0], q[1]) - cosine_similarity(vectors[0], vectors[1])
+    ) < 0.02
+    q_rec, scales_rec = bytes_to_vectors_int8(vectors_to_bytes_int8(q, scales), 384)
+    assert np.array_equal(q, q_rec) and np.array_equal(scales, scales_rec)
 
     return True, "vectors OK"
 
@@ -268,6 +388,14 @@ def test_drift_metrics() -> tuple[bool, str]:
     result = compute_drift_stats(old, new)
     assert result.num_matched == 2
 
+    # Normalized fast path agrees with the full computation
+    unit_old = {k: v / np.linalg.norm(v) for k, v in old.items()}
+    unit_new = {k: v / np.linalg.norm(v) for k, v in new.items()}
+    fast = compute_drift_stats(unit_old, unit_new, assume_normalized=True)
+    full = compute_drift_stats(unit_old, unit_new)
+    assert np.allclose(fast.cosine_distribution, full.cosine_distribution, atol=1e-12)
+    assert abs(compute_drift_cosine(e1, e2, assume_normalized=True) - 1.0) < 1e-12
+
     return True, "drift metrics OK"
 
 
@@ -311,7 +439,10 @@ def test_overlap_metrics() -> tuple[bool, str]:
 
 def test_maintenance_metrics() -> tuple[bool, str]:
     """Test maintenance metrics."""
-    from src.eval.maintenance import compute_maintenance_stats
+    from src.eval.maintenance import (
+        compute_cumulative_maintenance,
+        compute_maintenance_stats,
+    )
 
     old = {"a", "b", "c"}
     new = {"b", "c", "d", "e"}
@@ -322,46 +453,102 @@ def test_maintenance_metrics() -> tuple[bool, str]:
     assert result.added_chunks == 2  # d, e
     assert result.removed_chunks == 1  # a
 
-    return True, "maintenance metrics OK"
+    # Versions may be streamed from a generator
+    versions = [old, new, {"d", "e", "f"}]
+    from_list = compute_cumulative_maintenance(versions)
+    from_gen = compute_cumulative_maintenance(v for v in versions)
+    assert len(from_gen) == 2
+    assert [r.to_dict() for r in from_gen] == [r.to_dict() for r in from_list]
+
+    # A single version is rejected
+    try:
+        compute_cumulative_maintenance(iter([old]))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("single version accepted")
 
+    return True, "maintenance metrics OK"
 
-def run_tests(verbose: bool = False) -> int:
-    """Run all tests."""
-    tests = [
-        ("Config", test_config),
-        ("Cut Score", test_cut_score),
-        ("Offline Chunking", test_offline_chunking),
-        ("Streaming Chunking", test_streaming_chunking),
-        ("Data Generator", test_data_generator),
-        ("Manifests", test_manifests),
-        ("Vectors", test_vectors),
-        ("Drift Metrics", test_drift_metrics),
-        ("Churn Metrics", test_churn_metrics),
-        ("Overlap Metrics", test_overlap_metrics),
-        ("Maintenance Metrics", test_maintenance_metrics),
-    ]
 
+TESTS: list[tuple[str, Callable[[], tuple[bool, str]]]] = [
+    ("Config", test_config),
+    ("Cut Score", test_cut_score),
+    ("Offline Chunking", test_offline_chunking),
+    ("Streaming Chunking", test_streaming_chunking),
+    ("Data Generator", test_data_generator),
+    ("Manifests", test_manifests),
+    ("Vectors", test_vectors),
+    ("Drift Metrics", test_drift_metrics),
+    ("Churn Metrics", test_churn_metrics),
+    ("Overlap Metrics", test_overlap_metrics),
+    ("Maintenance Metrics", test_maintenance_metrics),
+]
+
+
+def _run_one(
+    name: str,
+    test_fn: Callable[[], tuple[bool, str]],
+) -> tuple[str, bool, str, str | None]:
+    """Run a single test, capturing its outcome.
+
+    Returns:
+        Tuple of (name, success, message, formatted traceback or None).
+    """
+    try:
+        success, msg = test_fn()
+        return name, success, msg, None
+    except Exception as e:
+        return name, False, str(e), traceback.format_exc()
+
+
+def _print_outcome(
+    outcome: tuple[str, bool, str, str | None],
+    verbose: bool,
+) -> bool:
+    """Print a single test outcome and return whether it passed."""
+    name, success, msg, tb = outcome
+    if success:
+        status = "\033[32mPASS\033[0m"
+    else:
+        status = "\033[31mFAIL\033[0m"
+    print(f"  [{status}] {name}: {msg}")
+    if tb is not None and verbose:
+        print(tb, end="")
+    return success
+
+
+def run_tests(verbose: bool = False, serial: bool = False) -> int:
+    """Run all tests.
+
+    Args:
+        verbose: Print tracebacks for failing tests.
+        serial: Run tests sequentially in this process instead of in a
+            process pool (results are then printed in declaration order
+            rather than completion order).
+    """
     passed = 0
     failed = 0
 
     print("Running tests...\n")
 
-    for name, test_fn in tests:
-        try:
-            success, msg = test_fn()
-            if success:
+    if serial:
+        for name, test_fn in TESTS:
+            if _print_outcome(_run_one(name, test_fn), verbose):
                 passed += 1
-                status = "\033[32mPASS\033[0m"
             else:
                 failed += 1
-                status = "\033[31mFAIL\033[0m"
-            print(f"  [{status}] {name}: {msg}")
-        except Exception as e:
-            failed += 1
-            status = "\033[31mFAIL\033[0m"
-            print(f"  [{status}] {name}: {e}")
-            if verbose:
-                traceback.print_exc()
+    else:
+        max_workers = min(len(TESTS), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_run_one, name, test_fn) for name, test_fn in TESTS
+            ]
+            for future in as_completed(futures):
+                if _print_outcome(future.result(), verbose):
+                    passed += 1
+                else:
+                    failed += 1
 
     print(f"\n{passed} passed, {failed} failed")
 
@@ -376,9 +563,14 @@ def main() -> int:
         action="store_true",
         help="Show verbose output",
     )
+    parser.add_argument(
+        "--serial",
+        action="store_true",
+        help="Run tests one at a time in this process",
+    )
 
     args = parser.parse_args()
-    return run_tests(verbose=args.verbose)
+    return run_tests(verbose=args.verbose, serial=args.serial)
 
 
 if __name__ == "__main__":
@@ -25,16 +25,19 @@ Signals are normalized via z-score within a trailing window.
 
 from __future__ import annotations
 
-import math
 from collections import deque
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from math import sqrt as _sqrt
+from typing import TYPE_CHECKING, Callable, Iterable
+
+import numpy as np
 
 if TYPE_CHECKING:
     from src.config import ChunkingConfig
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CutScoreSignals:
     """Raw signals used for cut-score computation.
 
@@ -57,7 +60,7 @@ class CutScoreSignals:
     L: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class NormalizedSignals:
     """Z-score normalized signals for cut-score computation.
 
@@ -84,12 +87,15 @@ def relu(x: float) -> float:
     return max(0.0, x)
 
 
-@dataclass
+@dataclass(slots=True)
 class RollingNormalizer:
     """Streaming z-score normalization over a trailing window.
 
     Maintains running statistics for efficient incremental normalization
-    of streaming signals.
+    of streaming signals. Mean and sum of squared deviations (M2) are
+    tracked with Welford's online algorithm, extended to a sliding window,
+    which avoids the catastrophic cancellation of the naive
+    ``sum_sq / n - mean**2`` formulation.
 
     Attributes:
         window_size: Number of samples to maintain in the window.
@@ -100,8 +106,8 @@ class RollingNormalizer:
     window_size: int = 1024
     min_samples: int = 10
     _values: deque[float] = field(default_factory=deque)
-    _sum: float = 0.0
-    _sum_sq: float = 0.0
+    _mean: float = 0.0
+    _m2: float = 0.0
 
     def __post_init__(self) -> None:
         """Initialize the deque with maxlen."""
@@ -116,38 +122,45 @@ class RollingNormalizer:
         Returns:
             Z-score normalized value, or raw value if insufficient samples.
         """
-        # Remove oldest value from running stats if window is full
-        if len(self._values) == self.window_size:
-            old_value = self._values[0]
-            self._sum -= old_value
-            self._sum_sq -= old_value * old_value
+        n = len(self._values)
 
-        # Add new value
-        self._values.append(value)
-        self._sum += value
-        self._sum_sq += value * value
+        if n == self.window_size:
+            # Window full: replace the oldest value in a single Welford step
+            old_value = self._values[0]
+            self._values.append(value)
+            old_mean = self._mean
+            self._mean = old_mean + (value - old_value) / n
+            self._m2 += (value - old_value) * (
+                value - self._mean + old_value - old_mean
+            )
+        else:
+            # Window growing: standard Welford update
+            self._values.append(value)
+            n += 1
+            delta = value - self._mean
+            self._mean += delta / n
+            self._m2 += delta * (value - self._mean)
 
         # Return raw value if insufficient samples
-        n = len(self._values)
         if n < self.min_samples:
             return value
 
         # Compute z-score
-        mean = self._sum / n
-        variance = (self._sum_sq / n) - (mean * mean)
+        mean = self._mean
+        variance = self._m2 / n
 
-        # Handle numerical precision issues
+        # Constant window (or rounding residue below zero)
         if variance < 1e-10:
             return 0.0
 
-        std = math.sqrt(variance)
+        std = _sqrt(variance)
         return (value - mean) / std
 
     def reset(self) -> None:
         """Reset the normalizer state."""
         self._values.clear()
-        self._sum = 0.0
-        self._sum_sq = 0.0
+        self._mean = 0.0
+        self._m2 = 0.0
 
     @property
     def count(self) -> int:
@@ -155,24 +168,89 @@ class RollingNormalizer:
         return len(self._values)
 
 
-@dataclass
+def _zscore(value: float, mean: float, m2: float, n: int) -> float:
+    """Z-score of ``value`` given Welford window statistics (mean, M2, n)."""
+    variance = m2 / n
+    if variance < 1e-10:
+        return 0.0
+    return (value - mean) / _sqrt(variance)
+
+
+@dataclass(slots=True)
 class SignalNormalizers:
     """Collection of normalizers for all signals.
 
-    Each signal type has its own normalizer to maintain independent
-    statistics.
+    K, S and D keep independent statistics, but always advance together,
+    so they share a single trailing window of (K, S, D) triples and are
+    updated in one packed Welford step per position (one window operation
+    instead of three). Results are identical to three RollingNormalizer
+    instances with the same window_size and min_samples.
     """
 
     window_size: int = 1024
-    K_normalizer: RollingNormalizer = field(init=False)
-    S_normalizer: RollingNormalizer = field(init=False)
-    D_normalizer: RollingNormalizer = field(init=False)
+    min_samples: int = 10
+    _values: deque[tuple[float, float, float]] = field(default_factory=deque)
+    _mean_K: float = 0.0
+    _m2_K: float = 0.0
+    _mean_S: float = 0.0
+    _m2_S: float = 0.0
+    _mean_D: float = 0.0
+    _m2_D: float = 0.0
 
     def __post_init__(self) -> None:
-        """Initialize individual normalizers."""
-        self.K_normalizer = RollingNormalizer(window_size=self.window_size)
-        self.S_normalizer = RollingNormalizer(window_size=self.window_size)
-        self.D_normalizer = RollingNormalizer(window_size=self.window_size)
+        """Initialize the shared window with maxlen."""
+        self._values = deque(maxlen=self.window_size)
+
+    def update(self, K: float, S: float, D: float) -> tuple[float, float, float]:
+        """Add one (K, S, D) sample and return the three z-scores.
+
+        Args:
+            K: Raw curvature value.
+            S: Raw stability margin value.
+            D: Raw disharmony value.
+
+        Returns:
+            Tuple of (K_norm, S_norm, D_norm); raw values during warmup.
+        """
+        values = self._values
+        n = len(values)
+
+        if n == self.window_size:
+            # Window full: replace the oldest triple in a single Welford step
+            old_K, old_S, old_D = values[0]
+            values.append((K, S, D))
+            mean = self._mean_K
+            self._mean_K = mean_K = mean + (K - old_K) / n
+            self._m2_K += (K - old_K) * (K - mean_K + old_K - mean)
+            mean = self._mean_S
+            self._mean_S = mean_S = mean + (S - old_S) / n
+            self._m2_S += (S - old_S) * (S - mean_S + old_S - mean)
+            mean = self._mean_D
+            self._mean_D = mean_D = mean + (D - old_D) / n
+            self._m2_D += (D - old_D) * (D - mean_D + old_D - mean)
+        else:
+            # Window growing: standard Welford update
+            values.append((K, S, D))
+            n += 1
+            delta = K - self._mean_K
+            self._mean_K = mean_K = self._mean_K + delta / n
+            self._m2_K += delta * (K - mean_K)
+            delta = S - self._mean_S
+            self._mean_S = mean_S = self._mean_S + delta / n
+            self._m2_S += delta * (S - mean_S)
+            delta = D - self._mean_D
+            self._mean_D = mean_D = self._mean_D + delta / n
+            self._m2_D += delta * (D - mean_D)
+
+        # Return raw values if insufficient samples
+        if n < self.min_samples:
+            return K, S, D
+
+        return (
+            _zscore(K, mean_K, self._m2_K, n),
+            _zscore(S, mean_S, self._m2_S, n),
+            _zscore(D, mean_D, self._m2_D, n),
+        )
 
     def normalize(self, signals: CutScoreSignals) -> NormalizedSignals:
         """Normalize raw signals using rolling z-score.
@@ -183,19 +261,205 @@ class SignalNormalizers:
         Returns:
             Normalized signal values.
         """
+        K_norm, S_norm, D_norm = self.update(signals.K, signals.S, signals.D)
         return NormalizedSignals(
-            K_norm=self.K_normalizer.update(signals.K),
-            S_norm=self.S_normalizer.update(signals.S),
-            D_norm=self.D_normalizer.update(signals.D),
+            K_norm=K_norm,
+            S_norm=S_norm,
+            D_norm=D_norm,
             B=signals.B,
             L=signals.L,
         )
 
+    def normalize_many(
+        self,
+        K: Iterable[float],
+        S: Iterable[float],
+        D: Iterable[float],
+    ) -> tuple[list[float], list[float], list[float]]:
+        """Normalize a sequence of (K, S, D) samples in arrival order.
+
+        Equivalent to calling normalize() per position, but takes the raw
+        signals as parallel sequences and returns parallel lists, so whole
+        scans run as one tight loop without per-position signal objects.
+
+        Args:
+            K: Raw curvature values.
+            S: Raw stability margin values.
+            D: Raw disharmony values.
+
+        Returns:
+            Tuple of (K_norm, S_norm, D_norm) lists.
+        """
+        update = self.update
+        normalized = [update(k, s, d) for k, s, d in zip(K, S, D)]
+        if not normalized:
+            return [], [], []
+        K_norm, S_norm, D_norm = zip(*normalized)
+        return list(K_norm), list(S_norm), list(D_norm)
+
     def reset(self) -> None:
         """Reset all normalizers."""
-        self.K_normalizer.reset()
-        self.S_normalizer.reset()
-        self.D_normalizer.reset()
+        self._values.clear()
+        self._mean_K = self._m2_K = 0.0
+        self._mean_S = self._m2_S = 0.0
+        self._mean_D = self._m2_D = 0.0
+
+    @property
+    def count(self) -> int:
+        """Return the current number of samples in the window."""
+        return len(self._values)
+
+
+def _score_normalized(norm: NormalizedSignals, config: ChunkingConfig) -> float:
+    """Apply the cut-score formula to already-normalized signals.
+
+    Reference implementation; scan loops use the specialized function
+    from make_scorer(), which must stay term-for-term identical.
+
+    Args:
+        norm: Normalized signal values.
+        config: Chunking configuration with weights and thresholds.
+
+    Returns:
+        The cut-score value.
+    """
+    score = 0.0
+
+    # Curvature term: high curvature -> good boundary
+    if config.use_curvature:
+        score += config.wK * relu(norm.K_norm - config.k0)
+
+    # Disharmony term: high disharmony -> good boundary
+    if config.use_disharmony:
+        score += config.wD * relu(norm.D_norm - config.d0)
+
+    # Stability margin term: LOW stability -> good boundary
+    # Note: s0 - S because we want boundaries where stability is LOW
+    if config.use_stability_margin:
+        score += config.wS * relu(config.s0 - norm.S_norm)
+
+    # Structural boundary term: direct contribution
+    if config.use_lil_boundaries:
+        score += config.wB * norm.B
+
+    # Length penalty term: penalize deviation from target length
+    # (scaled by the reciprocal, matching the constant make_scorer binds)
+    if config.L_target_bytes > 0:
+        length_deviation = (norm.L - config.L_target_bytes) * (
+            1.0 / config.L_target_bytes
+        )
+        score += config.wL * relu(length_deviation)
+
+    return score
+
+
+@lru_cache(maxsize=32)
+def make_scorer(config: ChunkingConfig) -> Callable[[NormalizedSignals], float]:
+    """Build a cut-score function specialized for a chunking configuration.
+
+    Generates a function equivalent to applying the cut-score formula to
+    normalized signals, with the feature toggles resolved at build time:
+    disabled terms are omitted and weights and thresholds are bound as
+    globals of the generated function, so the hot path carries no per-call
+    config lookups or toggle branches. Values are bound by name rather than
+    spliced in as source, so non-finite settings such as ``float("inf")``
+    work too. Scorers for the 32 most recently used configs are cached, so
+    sweeps over many configs do not grow the cache without bound.
+
+    Args:
+        config: Chunking configuration with weights, thresholds and toggles.
+
+    Returns:
+        Function mapping NormalizedSignals to the cut-score.
+    """
+    lines = ["def score(norm):", "    score = 0.0"]
+    namespace: dict[str, object] = {}
+
+    # Same term order as _score_normalized() so results are identical
+    if config.use_curvature:
+        lines += [
+            "    x = norm.K_norm - k0",
+            "    if x > 0.0:",
+            "        score += wK * x",
+        ]
+        namespace.update(k0=config.k0, wK=config.wK)
+    if config.use_disharmony:
+        lines += [
+            "    x = norm.D_norm - d0",
+            "    if x > 0.0:",
+            "        score += wD * x",
+        ]
+        namespace.update(d0=config.d0, wD=config.wD)
+    if config.use_stability_margin:
+        lines += [
+            "    x = s0 - norm.S_norm",
+            "    if x > 0.0:",
+            "        score += wS * x",
+        ]
+        namespace.update(s0=config.s0, wS=config.wS)
+    if config.use_lil_boundaries:
+        lines.append("    score += wB * norm.B")
+        namespace.update(wB=config.wB)
+    if config.L_target_bytes > 0:
+        lines += [
+            "    x = (norm.L - L_target) * inv_L_target",
+            "    if x > 0.0:",
+            "        score += wL * x",
+        ]
+        namespace.update(
+            L_target=config.L_target_bytes,
+            inv_L_target=1.0 / config.L_target_bytes,
+            wL=config.wL,
+        )
+    lines.append("    return score")
+
+    exec(compile("\n".join(lines), "<cut_score.make_scorer>", "exec"), namespace)
+    return namespace["score"]  # type: ignore[return-value]
+
+
+def score_normalized_arrays(
+    K_norm: np.ndarray,
+    S_norm: np.ndarray,
+    D_norm: np.ndarray,
+    B: np.ndarray,
+    L: np.ndarray,
+    config: ChunkingConfig,
+) -> np.ndarray:
+    """Apply the cut-score formula to arrays of normalized signals.
+
+    Vectorized counterpart of make_scorer(): terms are accumulated in the
+    same order with the same constants, so each element is bit-identical
+    to scoring that position individually.
+
+    Args:
+        K_norm: Normalized curvature per position.
+        S_norm: Normalized stability margin per position.
+        D_norm: Normalized disharmony per position.
+        B: Structural boundary indicator per position.
+        L: Chunk length per position.
+        config: Chunking configuration with weights and thresholds.
+
+    Returns:
+        float64 array of cut-scores.
+    """
+    score = np.zeros(len(K_norm), dtype=np.float64)
+
+    if config.use_curvature:
+        x = K_norm - config.k0
+        score += np.where(x > 0.0, config.wK * x, 0.0)
+    if config.use_disharmony:
+        x = D_norm - config.d0
+        score += np.where(x > 0.0, config.wD * x, 0.0)
+    if config.use_stability_margin:
+        x = config.s0 - S_norm
+        score += np.where(x > 0.0, config.wS * x, 0.0)
+    if config.use_lil_boundaries:
+        score += config.wB * B
+    if config.L_target_bytes > 0:
+        x = (L - config.L_target_bytes) * (1.0 / config.L_target_bytes)
+        score += np.where(x > 0.0, config.wL * x, 0.0)
+
+    return score
 
 
 def compute_cut_score(
@@ -230,32 +494,7 @@ def compute_cut_score(
             L=signals.L,
         )
 
-    # Compute cut-score components
-    score = 0.0
-
-    # Curvature term: high curvature -> good boundary
-    if config.use_curvature:
-        score += config.wK * relu(norm.K_norm - config.k0)
-
-    # Disharmony term: high disharmony -> good boundary
-    if config.use_disharmony:
-        score += config.wD * relu(norm.D_norm - config.d0)
-
-    # Stability margin term: LOW stability -> good boundary
-    # Note: s0 - S because we want boundaries where stability is LOW
-    if config.use_stability_margin:
-        score += config.wS * relu(config.s0 - norm.S_norm)
-
-    # Structural boundary term: direct contribution
-    if config.use_lil_boundaries:
-        score += config.wB * norm.B
-
-    # Length penalty term: penalize deviation from target length
-    if config.L_target_bytes > 0:
-        length_deviation = (norm.L - config.L_target_bytes) / config.L_target_bytes
-        score += config.wL * relu(length_deviation)
-
-    return score, norm
+    return _score_normalized(norm, config), norm
 
 
 def compute_cut_score_simple(
@@ -9,13 +9,29 @@ from __future__ import annotations
 
 import hashlib
 import json
-from dataclasses import asdict, dataclass, field
-from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any
+import os
+import time
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import accumulate
+from typing import TYPE_CHECKING, Any, Iterable, TextIO
 
-from src.chunking.cut_score import CutScoreSignals, NormalizedSignals
 from src.chunking.offline import Chunk
 
+# Batches with fewer chunks or bytes than these are hashed on the calling
+# thread; below them the hand-off costs more than parallel hashing saves.
+_PARALLEL_HASH_MIN_CHUNKS = 32
+_PARALLEL_HASH_MIN_BYTES = 1024 * 1024
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") of the last formatted timestamp
+_TIMESTAMP_CACHE: tuple[int, str] = (-1, "")
+
+# Shared hashing pool, created on first parallel batch (see _hash_executor)
+_HASH_EXECUTOR: ThreadPoolExecutor | None = None
+_HASH_WORKERS = os.cpu_count() or 1
+
 if TYPE_CHECKING:
     from src.config import ChunkingConfig, Config
 
@@ -59,6 +75,8 @@ class ChunkManifest:
         config: The chunking configuration parameters.
         created_at: ISO 8601 timestamp of manifest creation.
         version: Manifest format version.
+        merkle_root: Merkle root over the chunk content hashes (see
+            _merkle_root); absent in manifests older than 1.1.0.
     """
 
     doc_id: str
@@ -69,55 +87,180 @@ class ChunkManifest:
     config_hash: str
     config: dict[str, Any]
     created_at: str
-    version: str = "1.0.0"
+    version: str = "1.1.0"
+    merkle_root: str = ""
 
 
-def _signals_to_dict(signals: CutScoreSignals) -> dict[str, float]:
-    """Convert CutScoreSignals to a dictionary.
+def _compute_sha256(data: bytes) -> str:
+    """Compute SHA256 hash of bytes.
 
     Args:
-        signals: Raw signal values.
+        data: Bytes to hash.
 
     Returns:
-        Dictionary with signal names as keys.
+        Hex-encoded SHA256 hash.
     """
-    return {
-        "K": signals.K,
-        "S": signals.S,
-        "D": signals.D,
-        "B": signals.B,
-        "L": float(signals.L),
-    }
+    return hashlib.sha256(data).hexdigest()
 
 
-def _normalized_signals_to_dict(norm: NormalizedSignals) -> dict[str, float]:
-    """Convert NormalizedSignals to a dictionary.
+def _sha256_hexdigests(buffers: list[bytes]) -> list[str]:
+    """Hash a list of buffers sequentially.
 
     Args:
-        norm: Normalized signal values.
+        buffers: Buffers to hash.
 
     Returns:
-        Dictionary with signal names as keys.
+        Hex-encoded SHA256 hashes, in input order.
     """
-    return {
-        "K_norm": norm.K_norm,
-        "S_norm": norm.S_norm,
-        "D_norm": norm.D_norm,
-        "B": norm.B,
-        "L": float(norm.L),
-    }
+    sha256 = hashlib.sha256
+    return [sha256(buf).hexdigest() for buf in buffers]
 
 
-def _compute_sha256(data: bytes) -> str:
-    """Compute SHA256 hash of bytes.
+def _hash_executor() -> ThreadPoolExecutor:
+    """Return the module-level hashing thread pool, creating it on first use.
+
+    Returns:
+        Thread pool sized to the number of CPUs.
+    """
+    global _HASH_EXECUTOR
+    if _HASH_EXECUTOR is None:
+        _HASH_EXECUTOR = ThreadPoolExecutor(
+            max_workers=_HASH_WORKERS, thread_name_prefix="manifest-sha256"
+        )
+    return _HASH_EXECUTOR
+
+
+def _reset_hash_executor() -> None:
+    """Forget the hashing pool in a forked child.
+
+    A forked child inherits the executor object but not its worker threads,
+    so submitting to it would hang; the child builds its own pool instead.
+    """
+    global _HASH_EXECUTOR
+    _HASH_EXECUTOR = None
+
+
+if hasattr(os, "register_at_fork"):  # POSIX only
+    os.register_at_fork(after_in_child=_reset_hash_executor)
+
+
+def _compute_sha256_many(buffers: Iterable[bytes]) -> list[str]:
+    """Compute SHA256 hashes for a batch of buffers.
+
+    Hashes all buffers in a single pass with the constructor bound once,
+    avoiding the per-chunk helper call overhead that dominates for short
+    chunks. hashlib's OpenSSL backend uses SHA-NI where the CPU has it.
+
+    Chunk hashes are independent, so large batches are split into
+    contiguous slices hashed on a shared thread pool (hashlib releases the
+    GIL for buffers of 2 KiB and up). Slices hold roughly equal numbers of
+    bytes rather than of chunks, so mixed chunk sizes do not leave one
+    worker with most of the work. Slices are concatenated in order, so
+    the result is identical to the sequential path.
 
     Args:
-        data: Bytes to hash.
+        buffers: Buffers to hash.
 
     Returns:
-        Hex-encoded SHA256 hash.
+        Hex-encoded SHA256 hashes, in input order.
     """
-    return hashlib.sha256(data).hexdigest()
+    buffers = list(buffers)
+    if _HASH_WORKERS < 2 or len(buffers) < _PARALLEL_HASH_MIN_CHUNKS:
+        return _sha256_hexdigests(buffers)
+    ends = list(accumulate(map(len, buffers)))
+    total = ends[-1]
+    if total < _PARALLEL_HASH_MIN_BYTES:
+        return _sha256_hexdigests(buffers)
+
+    # Cut after the buffer where each worker's byte share is reached
+    cuts = [0]
+    for worker in range(1, _HASH_WORKERS):
+        cut = bisect_left(ends, total * worker // _HASH_WORKERS) + 1
+        if cut > cuts[-1]:
+            cuts.append(cut)
+    if cuts[-1] < len(buffers):
+        cuts.append(len(buffers))
+    slices = [buffers[a:b] for a, b in zip(cuts, cuts[1:])]
+    results = _hash_executor().map(_sha256_hexdigests, slices)
+    return [digest for part in results for digest in part]
+
+
+def _merkle_root(leaf_hashes: list[str]) -> str:
+    """Compute the Merkle root over a list of chunk content hashes.
+
+    Leaves are the raw SHA256 digests; each parent is
+    ``sha256(left || right)``. An unpaired node at the end of a level is
+    promoted unchanged rather than duplicated, so appending a copy of the
+    last chunk always changes the root. An empty list hashes to
+    ``sha256(b"")``.
+
+    Args:
+        leaf_hashes: Hex-encoded SHA256 hashes of the chunks, in order.
+
+    Returns:
+        Hex-encoded Merkle root.
+    """
+    if not leaf_hashes:
+        return hashlib.sha256(b"").hexdigest()
+
+    sha256 = hashlib.sha256
+    level = [bytes.fromhex(h) for h in leaf_hashes]
+    while len(level) > 1:
+        parents = [
+            sha256(level[i] + level[i + 1]).digest()
+            for i in range(0, len(level) - 1, 2)
+        ]
+        if len(level) % 2:
+            parents.append(level[-1])
+        level = parents
+    return level[0].hex()
+
+
+def _document_sha256_from_chunks(chunks: list[Chunk]) -> tuple[str, int]:
+    """Hash the document reconstructed from its chunks.
+
+    Feeds chunk contents into a single hasher instead of joining them.
+    Bytes a chunk shares with the previous chunk (overlap) are skipped, so
+    for chunks covering a document the result equals the document hash.
+
+    Args:
+        chunks: List of Chunk objects, ordered by byte offset.
+
+    Returns:
+        Tuple of (hex-encoded SHA256 hash, number of bytes hashed).
+    """
+    hasher = hashlib.sha256()
+    total_bytes = 0
+    prev_end = 0
+    for i, chunk in enumerate(chunks):
+        skip = max(0, prev_end - chunk.byte_start) if i > 0 else 0
+        if skip < len(chunk.content):
+            hasher.update(memoryview(chunk.content)[skip:])
+            total_bytes += len(chunk.content) - skip
+        prev_end = max(prev_end, chunk.byte_end)
+    return hasher.hexdigest(), total_bytes
+
+
+def _utc_timestamp() -> str:
+    """Return the current UTC time as an ISO 8601 string.
+
+    Same output as ``datetime.now(timezone.utc).isoformat()``, but the
+    date/time prefix is formatted once per second and reused, which
+    matters when manifests are generated in tight batches.
+
+    Returns:
+        Timestamp such as ``2026-01-16T12:00:00.123456+00:00``.
+    """
+    global _TIMESTAMP_CACHE
+    sec, us = divmod(time.time_ns() // 1000, 1_000_000)
+    cached_sec, prefix = _TIMESTAMP_CACHE
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _TIMESTAMP_CACHE = (sec, prefix)
+    # isoformat() omits the fractional part when it is zero
+    if us:
+        return f"{prefix}.{us:06d}+00:00"
+    return f"{prefix}+00:00"
 
 
 def _chunking_config_to_dict(config: ChunkingConfig) -> dict[str, Any]:
@@ -165,6 +308,64 @@ def _compute_config_hash(config_dict: dict[str, Any]) -> str:
     return hashlib.sha256(config_str.encode()).hexdigest()[:16]
 
 
+@lru_cache(maxsize=None)
+def _chunking_config_hash(config: ChunkingConfig) -> str:
+    """Compute the manifest config hash for a chunking configuration.
+
+    Cached per config (ChunkingConfig is frozen and hashable), so batch
+    pipelines that write many manifests with one config hash it once.
+
+    Args:
+        config: Chunking configuration.
+
+    Returns:
+        Truncated SHA256 hash (16 chars).
+    """
+    return _compute_config_hash(_chunking_config_to_dict(config))
+
+
+def _chunk_entry(index: int, chunk: Chunk, content_sha256: str) -> dict[str, Any]:
+    """Build the manifest entry for one chunk.
+
+    Produces the same dictionary as ``asdict(ChunkMetadata(...))`` without
+    going through the dataclass. Signal dicts are built inline: for the
+    slotted signal dataclasses a literal is cheaper than helper calls,
+    ``attrgetter`` or ``dict(zip(...))``.
+
+    Args:
+        index: Zero-based index of the chunk in the document.
+        chunk: The chunk.
+        content_sha256: SHA256 hash of the chunk content.
+
+    Returns:
+        Chunk metadata as a dictionary.
+    """
+    signals = chunk.signals
+    norm = chunk.normalized_signals
+    return {
+        "index": index,
+        "byte_start": chunk.byte_start,
+        "byte_end": chunk.byte_end,
+        "byte_length": len(chunk.content),
+        "content_sha256": content_sha256,
+        "cut_score": chunk.cut_score,
+        "signals": {
+            "K": signals.K,
+            "S": signals.S,
+            "D": signals.D,
+            "B": signals.B,
+            "L": float(signals.L),
+        },
+        "normalized_signals": {
+            "K_norm": norm.K_norm,
+            "S_norm": norm.S_norm,
+            "D_norm": norm.D_norm,
+            "B": norm.B,
+            "L": float(norm.L),
+        },
+    }
+
+
 def generate_manifest(
     chunks: list[Chunk],
     doc_id: str,
@@ -178,7 +379,8 @@ def generate_manifest(
         doc_id: Unique identifier for the document.
         config: Full Config or just ChunkingConfig.
         original_content: Original document bytes (optional, for doc hash).
-            If not provided, doc hash is computed from chunk contents.
+            If not provided, doc hash is computed from chunk contents,
+            with overlapping bytes counted once.
 
     Returns:
         Manifest as a dictionary suitable for JSON serialization.
@@ -190,46 +392,36 @@ def generate_manifest(
         chunking_config = config
 
     config_dict = _chunking_config_to_dict(chunking_config)
-    config_hash = _compute_config_hash(config_dict)
+    config_hash = _chunking_config_hash(chunking_config)
 
     # Compute document hash
     if original_content is not None:
         doc_hash = _compute_sha256(original_content)
         total_bytes = len(original_content)
     else:
-        # Reconstruct from chunks (assumes no overlap for accurate hash)
-        all_content = b"".join(chunk.content for chunk in chunks)
-        doc_hash = _compute_sha256(all_content)
-        total_bytes = sum(len(chunk.content) for chunk in chunks)
+        # Reconstruct from chunks, skipping overlapped bytes
+        doc_hash, total_bytes = _document_sha256_from_chunks(chunks)
 
     # Build chunk metadata
-    chunk_metadata_list: list[dict[str, Any]] = []
-    for i, chunk in enumerate(chunks):
-        metadata = ChunkMetadata(
-            index=i,
-            byte_start=chunk.byte_start,
-            byte_end=chunk.byte_end,
-            byte_length=len(chunk.content),
-            content_sha256=_compute_sha256(chunk.content),
-            cut_score=chunk.cut_score,
-            signals=_signals_to_dict(chunk.signals),
-            normalized_signals=_normalized_signals_to_dict(chunk.normalized_signals),
-        )
-        chunk_metadata_list.append(asdict(metadata))
-
-    # Build manifest
-    manifest = ChunkManifest(
-        doc_id=doc_id,
-        doc_content_sha256=doc_hash,
-        total_bytes=total_bytes,
-        chunk_count=len(chunks),
-        chunks=[ChunkMetadata(**m) for m in chunk_metadata_list],
-        config_hash=config_hash,
-        config=config_dict,
-        created_at=datetime.now(timezone.utc).isoformat(),
-    )
+    chunk_hashes = _compute_sha256_many(chunk.content for chunk in chunks)
+    chunk_entries = [
+        _chunk_entry(i, chunk, content_hash)
+        for i, (chunk, content_hash) in enumerate(zip(chunks, chunk_hashes))
+    ]
 
-    return asdict(manifest)
+    # Build manifest (same layout as asdict(ChunkManifest(...)))
+    return {
+        "doc_id": doc_id,
+        "doc_content_sha256": doc_hash,
+        "total_bytes": total_bytes,
+        "chunk_count": len(chunks),
+        "chunks": chunk_entries,
+        "config_hash": config_hash,
+        "config": config_dict,
+        "created_at": _utc_timestamp(),
+        "version": ChunkManifest.version,
+        "merkle_root": _merkle_root(chunk_hashes),
+    }
 
 
 def generate_manifest_from_bytes(
@@ -262,6 +454,86 @@ def generate_manifest_from_bytes(
     return generate_manifest(chunks, doc_id, config, original_content=data)
 
 
+def _dumps_indented(value: Any, prefix: str) -> str:
+    """Serialize a value as 2-space indented JSON nested under ``prefix``.
+
+    Args:
+        value: JSON-serializable value.
+        prefix: Indentation of the line the value starts on.
+
+    Returns:
+        JSON text whose continuation lines are shifted by ``prefix``.
+    """
+    return manifest_to_json(value).replace("\n", "\n" + prefix)
+
+
+def write_manifest(
+    fp: TextIO,
+    chunks: list[Chunk],
+    doc_id: str,
+    config: Config | ChunkingConfig,
+    original_content: bytes | None = None,
+) -> None:
+    """Write a chunk manifest as JSON directly to a text stream.
+
+    Streaming counterpart of ``manifest_to_json(generate_manifest(...))``:
+    produces the same document (2-space indent), but emits chunk entries
+    one at a time instead of materializing the manifest dictionary.
+
+    Args:
+        fp: Writable text stream.
+        chunks: List of Chunk objects.
+        doc_id: Unique identifier for the document.
+        config: Full Config or just ChunkingConfig.
+        original_content: Original document bytes (optional, for doc hash).
+            If not provided, doc hash is computed from chunk contents,
+            with overlapping bytes counted once.
+    """
+    # Extract chunking config
+    if hasattr(config, "chunking"):
+        chunking_config = config.chunking
+    else:
+        chunking_config = config
+
+    config_dict = _chunking_config_to_dict(chunking_config)
+
+    # Compute document hash
+    if original_content is not None:
+        doc_hash = _compute_sha256(original_content)
+        total_bytes = len(original_content)
+    else:
+        # Reconstruct from chunks, skipping overlapped bytes
+        doc_hash, total_bytes = _document_sha256_from_chunks(chunks)
+
+    write = fp.write
+    write("{\n")
+    write(f'  "doc_id": {manifest_to_json(doc_id)},\n')
+    write(f'  "doc_content_sha256": {manifest_to_json(doc_hash)},\n')
+    write(f'  "total_bytes": {total_bytes},\n')
+    write(f'  "chunk_count": {len(chunks)},\n')
+
+    chunk_hashes = _compute_sha256_many(chunk.content for chunk in chunks)
+    if chunks:
+        write('  "chunks": [')
+        separator = "\n    "
+        for i, (chunk, content_hash) in enumerate(zip(chunks, chunk_hashes)):
+            write(separator)
+            write(_dumps_indented(_chunk_entry(i, chunk, content_hash), "    "))
+            separator = ",\n    "
+        write("\n  ],\n")
+    else:
+        write('  "chunks": [],\n')
+
+    config_hash = _chunking_config_hash(chunking_config)
+    write(f'  "config_hash": {manifest_to_json(config_hash)},\n')
+    write(f'  "config": {_dumps_indented(config_dict, "  ")},\n')
+    created_at = _utc_timestamp()
+    write(f'  "created_at": {manifest_to_json(created_at)},\n')
+    write(f'  "version": {manifest_to_json(ChunkManifest.version)},\n')
+    write(f'  "merkle_root": {manifest_to_json(_merkle_root(chunk_hashes))}\n')
+    write("}")
+
+
 def manifest_to_json(manifest: dict[str, Any], indent: int = 2) -> str:
     """Convert manifest dictionary to JSON string.
 
@@ -275,6 +547,31 @@ def manifest_to_json(manifest: dict[str, Any], indent: int = 2) -> str:
     return json.dumps(manifest, indent=indent, sort_keys=False)
 
 
+# Manifest schema: required fields, in the order errors are reported
+_REQUIRED_MANIFEST_FIELDS = (
+    "doc_id",
+    "doc_content_sha256",
+    "total_bytes",
+    "chunk_count",
+    "chunks",
+    "config_hash",
+    "config",
+    "created_at",
+    "version",
+)
+_REQUIRED_CHUNK_FIELDS = (
+    "index",
+    "byte_start",
+    "byte_end",
+    "byte_length",
+    "content_sha256",
+    "cut_score",
+    "signals",
+    "normalized_signals",
+)
+_REQUIRED_CHUNK_FIELD_SET = frozenset(_REQUIRED_CHUNK_FIELDS)
+
+
 def validate_manifest(manifest: dict[str, Any]) -> tuple[bool, list[str]]:
     """Validate a manifest dictionary for required fields and consistency.
 
@@ -287,19 +584,7 @@ def validate_manifest(manifest: dict[str, Any]) -> tuple[bool, list[str]]:
     errors: list[str] = []
 
     # Check required top-level fields
-    required_fields = [
-        "doc_id",
-        "doc_content_sha256",
-        "total_bytes",
-        "chunk_count",
-        "chunks",
-        "config_hash",
-        "config",
-        "created_at",
-        "version",
-    ]
-
-    for field_name in required_fields:
+    for field_name in _REQUIRED_MANIFEST_FIELDS:
         if field_name not in manifest:
             errors.append(f"Missing required field: {field_name}")
 
@@ -314,19 +599,20 @@ def validate_manifest(manifest: dict[str, Any]) -> tuple[bool, list[str]]:
         )
 
     # Validate each chunk
-    required_chunk_fields = [
-        "index",
-        "byte_start",
-        "byte_end",
-        "byte_length",
-        "content_sha256",
-        "cut_score",
-        "signals",
-        "normalized_signals",
-    ]
-
     for i, chunk in enumerate(manifest["chunks"]):
-        for field_name in required_chunk_fields:
+        if _REQUIRED_CHUNK_FIELD_SET <= chunk.keys():
+            # Complete chunk (the common case): one subset test, direct access
+            expected_length = chunk["byte_end"] - chunk["byte_start"]
+            if chunk["byte_length"] != expected_length:
+                errors.append(
+                    f"Chunk {i}: byte_length {chunk['byte_length']} != "
+                    f"byte_end - byte_start ({expected_length})"
+                )
+            if chunk["index"] != i:
+                errors.append(f"Chunk {i}: index mismatch, found {chunk['index']}")
+            continue
+
+        for field_name in _REQUIRED_CHUNK_FIELDS:
             if field_name not in chunk:
                 errors.append(f"Chunk {i}: missing required field: {field_name}")
 
@@ -358,12 +644,18 @@ def validate_manifest(manifest: dict[str, Any]) -> tuple[bool, list[str]]:
 def verify_chunk_integrity(
     manifest: dict[str, Any],
     chunks: list[Chunk],
+    merkle_only: bool = False,
 ) -> tuple[bool, list[str]]:
     """Verify that chunks match their manifest metadata.
 
     Args:
         manifest: Manifest dictionary.
         chunks: List of Chunk objects to verify.
+        merkle_only: If True and the manifest has a ``merkle_root``, check
+            chunk contents against the root and, on mismatch, report only
+            the first chunk whose hash differs. Only error reporting is
+            shortened: every chunk is still hashed and its offsets and
+            length are still checked.
 
     Returns:
         Tuple of (all_valid, list of error messages).
@@ -377,10 +669,32 @@ def verify_chunk_integrity(
         )
         return False, errors
 
-    for i, (chunk, meta) in enumerate(zip(chunks, manifest["chunks"])):
+    chunk_hashes = _compute_sha256_many(chunk.content for chunk in chunks)
+
+    check_hashes = True
+    if merkle_only and manifest.get("merkle_root"):
+        check_hashes = False
+        actual_root = _merkle_root(chunk_hashes)
+        if actual_root != manifest["merkle_root"]:
+            errors.append(
+                f"Merkle root mismatch - expected {manifest['merkle_root']}, "
+                f"got {actual_root}"
+            )
+            for i, (meta, actual_hash) in enumerate(
+                zip(manifest["chunks"], chunk_hashes)
+            ):
+                if actual_hash != meta["content_sha256"]:
+                    errors.append(
+                        f"Chunk {i}: content hash mismatch - "
+                        f"expected {meta['content_sha256']}, got {actual_hash}"
+                    )
+                    break
+
+    for i, (chunk, meta, actual_hash) in enumerate(
+        zip(chunks, manifest["chunks"], chunk_hashes)
+    ):
         # Verify content hash
-        actual_hash = _compute_sha256(chunk.content)
-        if actual_hash != meta["content_sha256"]:
+        if check_hashes and actual_hash != meta["content_sha256"]:
             errors.append(
                 f"Chunk {i}: content hash mismatch - "
                 f"expected {meta['content_sha256']}, got {actual_hash}"
@@ -9,14 +9,18 @@ size constraints.
 from __future__ import annotations
 
 import math
+from collections import deque
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from src.chunking.cut_score import (
     CutScoreSignals,
     NormalizedSignals,
     SignalNormalizers,
-    compute_cut_score,
+    score_normalized_arrays,
 )
 
 if TYPE_CHECKING:
@@ -44,13 +48,13 @@ class Chunk:
     normalized_signals: NormalizedSignals
 
 
-def _compute_byte_entropy(data: bytes, start: int, window: int) -> float:
+def _compute_byte_entropy(data: np.ndarray, start: int, window: int) -> float:
     """Compute Shannon entropy of bytes in a window.
 
     Used as a proxy for curvature signal in v0.1.
 
     Args:
-        data: The full document bytes.
+        data: The full document as a uint8 array.
         start: Start position of the window.
         window: Window size in bytes.
 
@@ -61,24 +65,114 @@ def _compute_byte_entropy(data: bytes, start: int, window: int) -> float:
     if end <= start:
         return 0.0
 
-    window_bytes = data[start:end]
-    if len(window_bytes) == 0:
-        return 0.0
+    # Histogram of byte values, then entropy over the non-empty bins
+    counts = np.bincount(data[start:end], minlength=256)
+    p = counts[counts > 0] / (end - start)
+
+    return 0.0 - float(np.sum(p * np.log2(p)))
 
-    # Count byte frequencies
-    counts: dict[int, int] = {}
-    for b in window_bytes:
-        counts[b] = counts.get(b, 0) + 1
 
-    # Compute entropy
-    total = len(window_bytes)
-    entropy = 0.0
-    for count in counts.values():
-        if count > 0:
-            p = count / total
-            entropy -= p * math.log2(p)
+# Fixed-point scale for the rolling entropy accumulator. Summing integer
+# c*log2(c) terms keeps the running total exact, so it cannot drift over
+# long documents the way repeated float add/subtract would.
+ENTROPY_FIXED_POINT = 1 << 52
 
-    return entropy
+
+@lru_cache(maxsize=None)
+def entropy_tables(window: int) -> tuple[tuple[int, ...], tuple[float, ...]]:
+    """Return lookup tables for rolling entropy over windows of a given size.
+
+    Entropy of a window holding ``total`` bytes with per-byte ``counts`` is
+    ``log2(total) - sum(c * log2(c)) / total``; both terms are tabulated
+    for every count and total a window can hold.
+
+    Args:
+        window: Window size in bytes.
+
+    Returns:
+        Tuple of (clogc, log2_total): ``c * log2(c)`` in fixed point
+        (scaled by ENTROPY_FIXED_POINT) and ``log2(t)``, indexed by count.
+    """
+    clogc = (0,) + tuple(
+        round(c * math.log2(c) * ENTROPY_FIXED_POINT) for c in range(1, window + 1)
+    )
+    log2_total = (0.0,) + tuple(math.log2(t) for t in range(1, window + 1))
+    return clogc, log2_total
+
+
+def _rolling_window_signals(
+    data: np.ndarray, window: int
+) -> tuple[list[float], list[float]]:
+    """Compute byte entropy and variance for every position in one pass.
+
+    Position ``pos`` uses the same window as _compute_byte_entropy() and
+    _compute_byte_variance() called with ``start = max(0, pos - window // 2)``.
+    Consecutive windows share all but one byte, so the running state is
+    updated in O(1) per step:
+
+    - a 256-bin histogram, with entropy recovered as
+      ``log2(total) - sum(c * log2(c)) / total``;
+    - integer sum and sum of squares of byte values, with variance
+      ``(total * s2 - s1 * s1) / total**2`` (exact until the final divide).
+
+    Args:
+        data: The full document as a uint8 array.
+        window: Window size in bytes.
+
+    Returns:
+        Tuple of (entropies, variances), one value per position in ``data``.
+    """
+    n = len(data)
+    if n == 0 or window <= 0:
+        return [0.0] * n, [0.0] * n
+
+    half = window // 2
+    clogc, log2_total = entropy_tables(window)
+
+    values = data.tolist()
+    end = min(window, n)
+    counts = np.bincount(data[:end], minlength=256).tolist()
+    acc = sum(clogc[c] for c in counts)
+    s1 = sum(values[:end])
+    s2 = sum(b * b for b in values[:end])
+    start = 0
+
+    entropies: list[float] = []
+    variances: list[float] = []
+    for pos in range(n):
+        new_start = pos - half if pos > half else 0
+        new_end = new_start + window if new_start + window < n else n
+
+        while start < new_start:
+            b = values[start]
+            c = counts[b]
+            acc += clogc[c - 1] - clogc[c]
+            counts[b] = c - 1
+            s1 -= b
+            s2 -= b * b
+            start += 1
+        while end < new_end:
+            b = values[end]
+            c = counts[b]
+            acc += clogc[c + 1] - clogc[c]
+            counts[b] = c + 1
+            s1 += b
+            s2 += b * b
+            end += 1
+
+        total = end - start
+        if total <= 0:
+            entropies.append(0.0)
+        else:
+            entropies.append(
+                log2_total[total] - acc / (ENTROPY_FIXED_POINT * total)
+            )
+        if total < 2:
+            variances.append(0.0)
+        else:
+            variances.append((total * s2 - s1 * s1) / (total * total))
+
+    return entropies, variances
 
 
 def _compute_byte_variance(data: bytes, start: int, window: int) -> float:
@@ -135,6 +229,9 @@ def _compute_signals_at_position(
     pos: int,
     chunk_start: int,
     signal_window: int = 64,
+    data_np: np.ndarray | None = None,
+    K: float | None = None,
+    variance: float | None = None,
 ) -> CutScoreSignals:
     """Compute all signals at a given position.
 
@@ -143,17 +240,29 @@ def _compute_signals_at_position(
         pos: Current position.
         chunk_start: Start of current chunk (for length calculation).
         signal_window: Window size for signal computation.
+        data_np: Optional uint8 view of ``data``; pass it when scanning
+            many positions to avoid re-wrapping the buffer per call.
+        K: Optional precomputed entropy signal for the position (e.g.
+            from _rolling_window_signals()); computed here if omitted.
+        variance: Optional precomputed byte variance for the position;
+            computed here if omitted.
 
     Returns:
         CutScoreSignals at the position.
     """
     # K: curvature proxy via entropy (higher entropy = more "strain")
-    K = _compute_byte_entropy(data, max(0, pos - signal_window // 2), signal_window)
+    if K is None:
+        if data_np is None:
+            data_np = np.frombuffer(data, dtype=np.uint8)
+        K = _compute_byte_entropy(
+            data_np, max(0, pos - signal_window // 2), signal_window
+        )
 
     # S: stability margin proxy via inverse variance
-    variance = _compute_byte_variance(
-        data, max(0, pos - signal_window // 2), signal_window
-    )
+    if variance is None:
+        variance = _compute_byte_variance(
+            data, max(0, pos - signal_window // 2), signal_window
+        )
     # Normalize to roughly 0-8 range to match entropy scale
     # Using sigmoid-like transform for bounded output
     S = 8.0 / (1.0 + variance / 1000.0)
@@ -170,42 +279,144 @@ def _compute_signals_at_position(
     return CutScoreSignals(K=K, S=S, D=D, B=B, L=L)
 
 
-def _find_local_maxima(
-    scores: list[tuple[int, float, CutScoreSignals, NormalizedSignals]],
-    min_distance: int,
-) -> list[tuple[int, float, CutScoreSignals, NormalizedSignals]]:
-    """Find local maxima in cut-scores with minimum distance constraint.
+@dataclass(slots=True)
+class _PositionScores:
+    """Per-position scan results for chunk_offline, as parallel arrays.
+
+    Index ``pos`` of each array describes byte position ``pos``. Only the
+    score and normalized (K, S, D) values are stored; raw signals are a
+    cheap function of the rolling window stats and are recomputed for the
+    few positions that become chunk boundaries.
+
+    Attributes:
+        data: The full document bytes.
+        signal_window: Window size used for signal computation.
+        entropies: Rolling entropy per position.
+        variances: Rolling byte variance per position.
+        scores: Cut-score per position.
+        K_norm: Normalized curvature per position.
+        S_norm: Normalized stability margin per position.
+        D_norm: Normalized disharmony per position.
+    """
+
+    data: bytes
+    signal_window: int
+    entropies: list[float]
+    variances: list[float]
+    scores: np.ndarray
+    K_norm: np.ndarray
+    S_norm: np.ndarray
+    D_norm: np.ndarray
+
+    def signals_at(self, pos: int) -> CutScoreSignals:
+        """Return the raw signals used when scoring a position."""
+        return _compute_signals_at_position(
+            self.data,
+            pos,
+            0,
+            self.signal_window,
+            K=self.entropies[pos],
+            variance=self.variances[pos],
+        )
+
+    def normalized_at(self, pos: int, signals: CutScoreSignals) -> NormalizedSignals:
+        """Return the normalized signals for a position."""
+        return NormalizedSignals(
+            K_norm=float(self.K_norm[pos]),
+            S_norm=float(self.S_norm[pos]),
+            D_norm=float(self.D_norm[pos]),
+            B=signals.B,
+            L=signals.L,
+        )
+
+
+def _scan_positions(
+    data: bytes,
+    config: ChunkingConfig,
+    signal_window: int,
+) -> _PositionScores:
+    """Compute cut-scores and normalized signals at every position.
 
     Args:
-        scores: List of (position, score, signals, norm_signals) tuples.
-        min_distance: Minimum distance between maxima.
+        data: The document content as bytes.
+        config: Chunking configuration.
+        signal_window: Window size for signal computation.
 
     Returns:
-        List of local maxima tuples.
+        Per-position scan results.
     """
-    if not scores:
-        return []
+    normalizers = SignalNormalizers(window_size=config.commit_horizon_bytes)
 
-    maxima: list[tuple[int, float, CutScoreSignals, NormalizedSignals]] = []
+    data_np = np.frombuffer(data, dtype=np.uint8)
+    entropies, variances = _rolling_window_signals(data_np, signal_window)
+
+    # Raw signals for all positions at once, with the same elementwise
+    # arithmetic as _compute_signals_at_position()
+    K = np.asarray(entropies, dtype=np.float64)
+    S = 8.0 / (1.0 + np.asarray(variances, dtype=np.float64) / 1000.0)
+    D = np.zeros(len(data), dtype=np.float64)
+    B = (data_np == ord("\n")).astype(np.float64)
+    # Offline scoring measures length from the document start (chunk_start=0)
+    L = np.arange(len(data), dtype=np.float64)
+
+    # The rolling normalization is the only inherently sequential step
+    K_norm, S_norm, D_norm = (
+        np.asarray(values, dtype=np.float64)
+        for values in normalizers.normalize_many(K.tolist(), S.tolist(), D.tolist())
+    )
 
-    for i, (pos, score, signals, norm) in enumerate(scores):
-        is_maximum = True
+    return _PositionScores(
+        data=data,
+        signal_window=signal_window,
+        entropies=entropies,
+        variances=variances,
+        scores=score_normalized_arrays(K_norm, S_norm, D_norm, B, L, config),
+        K_norm=K_norm,
+        S_norm=S_norm,
+        D_norm=D_norm,
+    )
 
-        # Check neighbors within window
-        for j, (other_pos, other_score, _, _) in enumerate(scores):
-            if i == j:
-                continue
-            if abs(pos - other_pos) <= min_distance:
-                if other_score > score:
-                    is_maximum = False
-                    break
-                # Tie-breaker: prefer later position
-                if other_score == score and other_pos > pos:
-                    is_maximum = False
-                    break
 
-        if is_maximum:
-            maxima.append((pos, score, signals, norm))
+def _find_local_maxima(
+    scores: list[float],
+    min_distance: int,
+) -> list[int]:
+    """Find local maxima in cut-scores with minimum distance constraint.
+
+    A position is a local maximum if no other position within
+    ``min_distance`` has a higher score; ties go to the later position.
+    Computed in O(N) with a sliding-window maximum over (score, position):
+    a monotonic deque holds indices of the window's candidates in
+    decreasing score order, so its front is the window maximum.
+
+    Args:
+        scores: Cut-scores of consecutive positions.
+        min_distance: Minimum distance between maxima.
+
+    Returns:
+        Indices (into ``scores``) of the local maxima, in order.
+    """
+    maxima: list[int] = []
+    window: deque[int] = deque()
+    n = len(scores)
+    right = 0
+
+    for i in range(n):
+        # Admit positions up to i + min_distance; an equal score at a
+        # later position wins the tie, so it evicts the earlier entry.
+        while right < n and right <= i + min_distance:
+            score = scores[right]
+            while window and scores[window[-1]] <= score:
+                window.pop()
+            window.append(right)
+            right += 1
+
+        # Drop positions that fell out of the window on the left
+        while window[0] < i - min_distance:
+            window.popleft()
+
+        if window[0] == i:
+            maxima.append(i)
 
     return maxima
 
@@ -247,25 +458,10 @@ def chunk_offline(
             )
         ]
 
-    # Initialize normalizers
-    normalizers = SignalNormalizers(window_size=config.commit_horizon_bytes)
-
-    # First pass: compute cut-scores at all positions
-    all_scores: list[tuple[int, float, CutScoreSignals, NormalizedSignals]] = []
-
-    # We only consider positions >= min_bytes from chunk start
-    # and we need to track chunk starts dynamically
-    # For offline, we'll do a simpler approach: compute scores for all positions
-    # then select boundaries greedily
-
-    current_chunk_start = 0
-
-    for pos in range(len(data)):
-        signals = _compute_signals_at_position(
-            data, pos, current_chunk_start, signal_window
-        )
-        score, norm = compute_cut_score(signals, config, normalizers)
-        all_scores.append((pos, score, signals, norm))
+    # First pass: compute cut-scores at all positions, then select
+    # boundaries greedily. Position i lives at index i of every array.
+    scan = _scan_positions(data, config, signal_window)
+    scores = scan.scores
 
     # Select boundaries using greedy algorithm with constraints
     chunks: list[Chunk] = []
@@ -283,13 +479,15 @@ def chunk_offline(
                 K_norm=0.0, S_norm=0.0, D_norm=0.0, B=0.0, L=remaining
             )
 
-            # Get the best score from within this final chunk for metadata
-            for pos, score, signals, norm in all_scores:
-                if current_start < pos <= len(data) and pos >= current_start + config.min_bytes:
-                    if score > best_score:
-                        best_score = score
-                        best_signals = signals
-                        best_norm = norm
+            # Get the best (first highest, if positive) score from within
+            # this final chunk for metadata
+            first = max(current_start + max(1, config.min_bytes), 0)
+            if first < len(scores):
+                best_pos = first + int(np.argmax(scores[first:]))
+                if scores[best_pos] > best_score:
+                    best_score = float(scores[best_pos])
+                    best_signals = scan.signals_at(best_pos)
+                    best_norm = scan.normalized_at(best_pos, best_signals)
 
             chunks.append(
                 Chunk(
@@ -304,16 +502,12 @@ def chunk_offline(
             break
 
         # Find valid boundary candidates within [min_bytes, max_bytes] from current_start
-        min_pos = current_start + config.min_bytes
+        min_pos = max(current_start + config.min_bytes, 0)
         max_pos = min(current_start + config.max_bytes, len(data))
 
-        candidates = [
-            (pos, score, signals, norm)
-            for pos, score, signals, norm in all_scores
-            if min_pos <= pos <= max_pos
-        ]
+        candidates = scores[min_pos : max(max_pos + 1, min_pos)]
 
-        if not candidates:
+        if len(candidates) == 0:
             # No valid candidates - force boundary at max_bytes
             end_pos = max_pos
             signals = _compute_signals_at_position(
@@ -340,25 +534,29 @@ def chunk_offline(
             continue
 
         # Find local maxima among candidates
-        maxima = _find_local_maxima(candidates, min_distance=config.min_bytes // 4)
+        candidate_scores = candidates.tolist()
+        maxima = _find_local_maxima(
+            candidate_scores, min_distance=config.min_bytes // 4
+        )
 
         if maxima:
             # Select the highest scoring maximum
-            best = max(maxima, key=lambda x: x[1])
+            best = max(maxima, key=candidate_scores.__getitem__)
         else:
             # Fall back to highest scoring candidate
-            best = max(candidates, key=lambda x: x[1])
+            best = int(np.argmax(candidates))
 
-        end_pos, score, signals, norm = best
+        end_pos = min_pos + best
+        signals = scan.signals_at(end_pos)
 
         chunks.append(
             Chunk(
                 byte_start=current_start,
                 byte_end=end_pos,
                 content=data[current_start:end_pos],
-                cut_score=score,
+                cut_score=candidate_scores[best],
                 signals=signals,
-                normalized_signals=norm,
+                normalized_signals=scan.normalized_at(end_pos, signals),
             )
         )
 
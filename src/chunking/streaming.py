@@ -7,24 +7,38 @@ and committing chunks when trigger conditions are met.
 
 from __future__ import annotations
 
-import math
-from collections import deque
+import hashlib
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Iterator
+from typing import TYPE_CHECKING, Callable, Iterator
+
+import numpy as np
 
 from src.chunking.cut_score import (
     CutScoreSignals,
     NormalizedSignals,
     SignalNormalizers,
-    compute_cut_score,
+    make_scorer,
+    score_normalized_arrays,
 )
-from src.chunking.offline import Chunk
+from src.chunking.offline import ENTROPY_FIXED_POINT, Chunk, entropy_tables
 
 if TYPE_CHECKING:
     from src.config import ChunkingConfig
 
+# Curvature (K) proxies the streaming chunker can compute per position.
+CURVATURE_PROXIES = ("entropy", "gear")
 
-@dataclass
+_GEAR_MASK = (1 << 64) - 1
+
+# Gear rolling-hash table: 64-bit values derived from SHA-256 rather than a
+# PRNG, so they are identical across platforms and library versions.
+_GEAR_TABLE = tuple(
+    int.from_bytes(hashlib.sha256(b"gear" + bytes([i])).digest()[:8], "little")
+    for i in range(256)
+)
+
+
+@dataclass(slots=True, frozen=True)
 class BoundaryCandidate:
     """A potential chunk boundary with its metadata.
 
@@ -43,6 +57,514 @@ class BoundaryCandidate:
     normalized_signals: NormalizedSignals
 
 
+@dataclass(slots=True)
+class _ByteWindow:
+    """Rolling byte statistics over a window of the stream.
+
+    Covers stream positions ``[start, end)`` in global byte offsets, so it
+    stays valid while committed bytes are dropped from the buffer. Holds a
+    256-bin histogram with a fixed-point sum of ``c * log2(c)`` for entropy
+    (as in offline._rolling_window_signals()) and integer sum and sum of
+    squares for variance. Sliding forward costs O(1) per byte entering or
+    leaving; moving backwards or past dropped bytes rebuilds the window.
+
+    Attributes:
+        window: Maximum window size in bytes (the signal window).
+        track_entropy: Whether to maintain the histogram and entropy sum.
+            Streams using another curvature proxy only need the variance.
+        counts: Per-byte-value counts.
+        acc: Fixed-point sum of ``c * log2(c)`` over ``counts``.
+        s1: Sum of byte values.
+        s2: Sum of squared byte values.
+        start: Global offset of the first byte in the window.
+        end: Global offset one past the last byte in the window.
+    """
+
+    window: int
+    track_entropy: bool = True
+    counts: list[int] = field(default_factory=lambda: [0] * 256)
+    acc: int = 0
+    s1: int = 0
+    s2: int = 0
+    start: int = 0
+    end: int = 0
+
+    def slide(self, buffer: bytearray, offset: int, start: int, end: int) -> None:
+        """Move the window to cover global positions ``[start, end)``.
+
+        Args:
+            buffer: Byte buffer holding the window's bytes.
+            offset: Global offset of ``buffer[0]``.
+            start: New global start of the window.
+            end: New global end of the window.
+        """
+        counts = self.counts
+        clogc = entropy_tables(self.window)[0]
+        acc = self.acc
+        s1 = self.s1
+        s2 = self.s2
+
+        if (
+            start < self.start
+            or end < self.end
+            or start >= self.end
+            or self.start < offset
+        ):
+            # No usable overlap with the current window: rebuild it
+            counts[:] = [0] * 256
+            acc = s1 = s2 = 0
+            self.start = self.end = start
+
+        leaving = buffer[self.start - offset : start - offset]
+        entering = buffer[self.end - offset : end - offset]
+        if self.track_entropy:
+            for b in leaving:
+                c = counts[b]
+                acc += clogc[c - 1] - clogc[c]
+                counts[b] = c - 1
+                s1 -= b
+                s2 -= b * b
+            for b in entering:
+                c = counts[b]
+                acc += clogc[c + 1] - clogc[c]
+                counts[b] = c + 1
+                s1 += b
+                s2 += b * b
+        else:
+            for b in leaving:
+                s1 -= b
+                s2 -= b * b
+            for b in entering:
+                s1 += b
+                s2 += b * b
+
+        self.acc = acc
+        self.s1 = s1
+        self.s2 = s2
+        self.start = start
+        self.end = end
+
+    def sweep(
+        self, buffer: bytearray, offset: int, lo: int, hi: int
+    ) -> tuple[list[float], list[float]]:
+        """Slide the window across buffer positions ``lo..hi``.
+
+        Position ``pos`` covers the same bytes as a signal window starting at
+        ``max(0, pos - window // 2)``. Equivalent to calling slide(),
+        entropy() and variance() per position, with the loop inlined.
+
+        Args:
+            buffer: Byte buffer holding the windows' bytes.
+            offset: Global offset of ``buffer[0]``.
+            lo: First buffer position.
+            hi: Last buffer position (inclusive).
+
+        Returns:
+            Tuple of (entropies, variances), one value per position;
+            entropies is empty when track_entropy is False.
+        """
+        if not self.track_entropy:
+            return [], self._sweep_variances(buffer, offset, lo, hi)
+
+        window = self.window
+        half = window // 2
+        n = len(buffer)
+        clogc, log2_total = entropy_tables(window)
+
+        entropies: list[float] = []
+        variances: list[float] = []
+        if hi < lo:
+            return entropies, variances
+
+        # Position the window on ``lo`` (rebuilding it if needed), then roll
+        first = max(0, lo - half)
+        last = max(first, min(first + window, n))
+        self.slide(buffer, offset, offset + first, offset + last)
+        counts = self.counts
+        acc = self.acc
+        s1 = self.s1
+        s2 = self.s2
+        start = self.start - offset
+        end = self.end - offset
+        scale = ENTROPY_FIXED_POINT
+
+        for pos in range(lo, hi + 1):
+            new_start = pos - half if pos > half else 0
+            new_end = new_start + window if new_start + window < n else n
+            if new_end < new_start:
+                new_end = new_start
+
+            while start < new_start:
+                b = buffer[start]
+                c = counts[b]
+                acc += clogc[c - 1] - clogc[c]
+                counts[b] = c - 1
+                s1 -= b
+                s2 -= b * b
+                start += 1
+            while end < new_end:
+                b = buffer[end]
+                c = counts[b]
+                acc += clogc[c + 1] - clogc[c]
+                counts[b] = c + 1
+                s1 += b
+                s2 += b * b
+                end += 1
+
+            total = end - start
+            if total <= 0:
+                entropies.append(0.0)
+            else:
+                entropies.append(log2_total[total] - acc / (scale * total))
+            if total < 2:
+                variances.append(0.0)
+            else:
+                variances.append((total * s2 - s1 * s1) / (total * total))
+
+        self.acc = acc
+        self.s1 = s1
+        self.s2 = s2
+        self.start = offset + start
+        self.end = offset + end
+        return entropies, variances
+
+    def _sweep_variances(
+        self, buffer: bytearray, offset: int, lo: int, hi: int
+    ) -> list[float]:
+        """Variance-only sweep(), for windows that do not track entropy.
+
+        Args:
+            buffer: Byte buffer holding the windows' bytes.
+            offset: Global offset of ``buffer[0]``.
+            lo: First buffer position.
+            hi: Last buffer position (inclusive).
+
+        Returns:
+            Variances, one value per position.
+        """
+        window = self.window
+        half = window // 2
+        n = len(buffer)
+
+        variances: list[float] = []
+        if hi < lo:
+            return variances
+
+        first = max(0, lo - half)
+        last = max(first, min(first + window, n))
+        self.slide(buffer, offset, offset + first, offset + last)
+        s1 = self.s1
+        s2 = self.s2
+        start = self.start - offset
+        end = self.end - offset
+
+        for pos in range(lo, hi + 1):
+            new_start = pos - half if pos > half else 0
+            new_end = new_start + window if new_start + window < n else n
+            if new_end < new_start:
+                new_end = new_start
+
+            while start < new_start:
+                b = buffer[start]
+                s1 -= b
+                s2 -= b * b
+                start += 1
+            while end < new_end:
+                b = buffer[end]
+                s1 += b
+                s2 += b * b
+                end += 1
+
+            total = end - start
+            if total < 2:
+                variances.append(0.0)
+            else:
+                variances.append((total * s2 - s1 * s1) / (total * total))
+
+        self.s1 = s1
+        self.s2 = s2
+        self.start = offset + start
+        self.end = offset + end
+        return variances
+
+    def entropy(self) -> float:
+        """Return the Shannon entropy of the window in bits."""
+        total = self.end - self.start
+        if total <= 0:
+            return 0.0
+        log2_total = entropy_tables(self.window)[1]
+        return log2_total[total] - self.acc / (ENTROPY_FIXED_POINT * total)
+
+    def variance(self) -> float:
+        """Return the variance of byte values in the window."""
+        total = self.end - self.start
+        if total < 2:
+            return 0.0
+        return (total * self.s2 - self.s1 * self.s1) / (total * total)
+
+
+@dataclass(slots=True)
+class _GearWindow:
+    """Rolling Gear hash over a window of the stream (the "gear" K proxy).
+
+    Hashes the same windows as _ByteWindow with a Gear rolling hash,
+    ``h = sum(GEAR[b_i] << (end - 1 - i))`` mod 2**64, and reports the
+    number of trailing zero bits of the hash. Long zero runs are the
+    content-defined cut points of Gear/FastCDC chunking, so K peaks where
+    a CDC chunker would cut, independent of where the stream started.
+
+    Covers stream positions ``[start, end)`` in global byte offsets.
+    Sliding forward costs O(1) per byte entering or leaving; moving
+    backwards or past dropped bytes rebuilds the window. The hash depends
+    only on the window's bytes, so rolling and rebuilding agree.
+
+    Attributes:
+        window: Maximum window size in bytes (the signal window).
+        h: Hash of the bytes in the window.
+        start: Global offset of the first byte in the window.
+        end: Global offset one past the last byte in the window.
+    """
+
+    window: int
+    h: int = 0
+    start: int = 0
+    end: int = 0
+
+    def slide(self, buffer: bytearray, offset: int, start: int, end: int) -> None:
+        """Move the window to cover global positions ``[start, end)``.
+
+        Args:
+            buffer: Byte buffer holding the window's bytes.
+            offset: Global offset of ``buffer[0]``.
+            start: New global start of the window.
+            end: New global end of the window.
+        """
+        gear = _GEAR_TABLE
+        h = self.h
+        cur_start = self.start
+        cur_end = self.end
+
+        if (
+            start < cur_start
+            or end < cur_end
+            or start >= cur_end
+            or cur_start < offset
+        ):
+            # No usable overlap with the current window: rebuild it
+            h = 0
+            cur_start = cur_end = start
+
+        # Add new bytes before dropping old ones, so the window being
+        # trimmed is never empty
+        for b in buffer[cur_end - offset : end - offset]:
+            h = ((h << 1) + gear[b]) & _GEAR_MASK
+        for b in buffer[cur_start - offset : start - offset]:
+            h = (h - (gear[b] << (end - cur_start - 1))) & _GEAR_MASK
+            cur_start += 1
+
+        self.h = h
+        self.start = start
+        self.end = end
+
+    def sweep(self, buffer: bytearray, offset: int, lo: int, hi: int) -> list[float]:
+        """Slide the window across buffer positions ``lo..hi``.
+
+        Position ``pos`` covers the same bytes as a signal window starting at
+        ``max(0, pos - window // 2)``. Equivalent to calling slide() and
+        curvature() per position, with the loop inlined.
+
+        Args:
+            buffer: Byte buffer holding the windows' bytes.
+            offset: Global offset of ``buffer[0]``.
+            lo: First buffer position.
+            hi: Last buffer position (inclusive).
+
+        Returns:
+            Trailing-zero counts (0-64) as floats, one per position.
+        """
+        window = self.window
+        half = window // 2
+        n = len(buffer)
+        gear = _GEAR_TABLE
+
+        values: list[float] = []
+        if hi < lo:
+            return values
+
+        # Position the window on ``lo`` (rebuilding it if needed), then roll
+        first = max(0, lo - half)
+        last = max(first, min(first + window, n))
+        self.slide(buffer, offset, offset + first, offset + last)
+        h = self.h
+        start = self.start - offset
+        end = self.end - offset
+
+        for pos in range(lo, hi + 1):
+            new_start = pos - half if pos > half else 0
+            new_end = new_start + window if new_start + window < n else n
+            if new_end < new_start:
+                new_end = new_start
+
+            while end < new_end:
+                h = ((h << 1) + gear[buffer[end]]) & _GEAR_MASK
+                end += 1
+            while start < new_start:
+                h = (h - (gear[buffer[start]] << (end - start - 1))) & _GEAR_MASK
+                start += 1
+            values.append(float((h & -h).bit_length() - 1) if h else 64.0)
+
+        self.h = h
+        self.start = offset + start
+        self.end = offset + end
+        return values
+
+    def curvature(self) -> float:
+        """Return the number of trailing zero bits of the hash (64 if zero)."""
+        h = self.h
+        return float((h & -h).bit_length() - 1) if h else 64.0
+
+
+@dataclass(slots=True)
+class _CandidateRing:
+    """Fixed-capacity ring of recent boundary candidates, stored as arrays.
+
+    Structure-of-arrays replacement for a ``deque[BoundaryCandidate]``:
+    each field lives in a preallocated array indexed by slot, so recording
+    a candidate writes a few numbers instead of allocating three objects.
+    When full, the oldest candidate is overwritten. BoundaryCandidate
+    objects are only built on request via candidate().
+
+    Attributes:
+        capacity: Maximum number of candidates kept.
+        positions: Buffer position per slot.
+        global_positions: Stream position per slot.
+        scores: Cut-score per slot.
+        signals: Raw (K, S, D, B) signals per slot.
+        normalized: Normalized (K_norm, S_norm, D_norm) signals per slot.
+        lengths: Chunk length (the L signal) per slot.
+        head: Slot of the oldest candidate.
+        size: Number of candidates held.
+    """
+
+    capacity: int = 256
+    positions: np.ndarray = field(init=False)
+    global_positions: np.ndarray = field(init=False)
+    scores: np.ndarray = field(init=False)
+    signals: np.ndarray = field(init=False)
+    normalized: np.ndarray = field(init=False)
+    lengths: np.ndarray = field(init=False)
+    head: int = 0
+    size: int = 0
+
+    def __post_init__(self) -> None:
+        """Allocate the per-slot arrays."""
+        self.positions = np.zeros(self.capacity, dtype=np.int64)
+        self.global_positions = np.zeros(self.capacity, dtype=np.int64)
+        self.scores = np.zeros(self.capacity, dtype=np.float64)
+        self.signals = np.zeros((self.capacity, 4), dtype=np.float64)
+        self.normalized = np.zeros((self.capacity, 3), dtype=np.float64)
+        self.lengths = np.zeros(self.capacity, dtype=np.int64)
+
+    def __len__(self) -> int:
+        """Return the number of candidates held."""
+        return self.size
+
+    def append(
+        self,
+        position: int,
+        global_position: int,
+        score: float,
+        signals: tuple[float, float, float, float],
+        normalized: tuple[float, float, float],
+        length: int,
+    ) -> int:
+        """Record a candidate, overwriting the oldest one when full.
+
+        Args:
+            position: Buffer position.
+            global_position: Stream position.
+            score: Cut-score.
+            signals: Raw (K, S, D, B) signals.
+            normalized: Normalized (K_norm, S_norm, D_norm) signals.
+            length: Chunk length (the L signal).
+
+        Returns:
+            Slot the candidate was written to.
+        """
+        if self.size < self.capacity:
+            slot = (self.head + self.size) % self.capacity
+            self.size += 1
+        else:
+            slot = self.head
+            self.head = (self.head + 1) % self.capacity
+        self.positions[slot] = position
+        self.global_positions[slot] = global_position
+        self.scores[slot] = score
+        self.signals[slot] = signals
+        self.normalized[slot] = normalized
+        self.lengths[slot] = length
+        return slot
+
+    def latest(self) -> int:
+        """Return the slot of the newest candidate, or -1 if empty."""
+        if self.size == 0:
+            return -1
+        return (self.head + self.size - 1) % self.capacity
+
+    def candidate(self, slot: int) -> BoundaryCandidate:
+        """Build the BoundaryCandidate stored in a slot.
+
+        Args:
+            slot: Slot to read.
+
+        Returns:
+            The candidate.
+        """
+        K, S, D, B = self.signals[slot].tolist()
+        K_norm, S_norm, D_norm = self.normalized[slot].tolist()
+        length = int(self.lengths[slot])
+        return BoundaryCandidate(
+            position=int(self.positions[slot]),
+            global_position=int(self.global_positions[slot]),
+            score=float(self.scores[slot]),
+            signals=CutScoreSignals(K=K, S=S, D=D, B=B, L=length),
+            normalized_signals=NormalizedSignals(
+                K_norm=K_norm, S_norm=S_norm, D_norm=D_norm, B=B, L=length
+            ),
+        )
+
+    def best_in_range(self, min_pos: int, max_pos: int) -> BoundaryCandidate | None:
+        """Return the highest-scoring candidate with position in a range.
+
+        Ties go to the oldest candidate. Selection is a masked argmax over
+        the slots in age order, so no Python-level loop runs per candidate.
+
+        Args:
+            min_pos: Smallest allowed buffer position.
+            max_pos: Largest allowed buffer position.
+
+        Returns:
+            The best candidate, or None if no candidate is in range.
+        """
+        if self.size == 0:
+            return None
+
+        order = (self.head + np.arange(self.size)) % self.capacity
+        positions = self.positions[order]
+        scores = self.scores[order]
+        # NaN and -inf scores never win, matching a strict ">" scan
+        valid = (positions >= min_pos) & (positions <= max_pos) & (scores > -np.inf)
+        if not valid.any():
+            return None
+        best = int(np.where(valid, scores, -np.inf).argmax())
+        return self.candidate(int(order[best]))
+
+    def clear(self) -> None:
+        """Drop all candidates."""
+        self.head = 0
+        self.size = 0
+
+
 @dataclass
 class StreamingChunkerState:
     """Internal state for the streaming chunker.
@@ -55,6 +577,16 @@ class StreamingChunkerState:
         best_boundary: Best boundary candidate within the commit horizon.
         soft_trigger_count: Number of consecutive steps above soft threshold.
         candidates: Recent boundary candidates in the commit horizon.
+        byte_window: Rolling entropy/variance statistics, created for the
+            signal window on first use.
+        gear_window: Rolling Gear hash for the "gear" curvature proxy,
+            created for the signal window on first use.
+        scan_signals: Raw (K, S, D, B) rows from the last hard-commit scan,
+            for consecutive positions starting at scan_signals_start.
+        scan_signals_start: Global byte offset of scan_signals[0].
+        scorer: Cut-score function specialized for the stream's config by
+            make_scorer(); resolved once per stream on first use.
+        curvature_proxy: Signal used for K, one of CURVATURE_PROXIES.
     """
 
     buffer: bytearray = field(default_factory=bytearray)
@@ -65,85 +597,129 @@ class StreamingChunkerState:
     )
     best_boundary: BoundaryCandidate | None = None
     soft_trigger_count: int = 0
-    candidates: deque[BoundaryCandidate] = field(
-        default_factory=lambda: deque(maxlen=256)
+    candidates: _CandidateRing = field(default_factory=_CandidateRing)
+    byte_window: _ByteWindow | None = None
+    gear_window: _GearWindow | None = None
+    scan_signals: np.ndarray = field(
+        default_factory=lambda: np.zeros((0, 4), dtype=np.float64)
     )
+    scan_signals_start: int = 0
+    scorer: Callable[[NormalizedSignals], float] | None = None
+    curvature_proxy: str = "entropy"
+
 
+def _signal_values_at_buffer_position(
+    buffer: bytearray,
+    pos: int,
+    signal_window: int = 64,
+    *,
+    byte_window: _ByteWindow,
+    offset: int,
+    gear_window: _GearWindow | None = None,
+) -> tuple[float, float, float, float]:
+    """Compute the raw (K, S, D, B) signal values at a buffer position.
 
-def _compute_byte_entropy_buffer(buffer: bytearray, start: int, window: int) -> float:
-    """Compute Shannon entropy of bytes in a buffer window.
+    Returns plain floats so scan loops only build CutScoreSignals for
+    positions they keep.
 
     Args:
         buffer: The byte buffer.
-        start: Start position of the window.
-        window: Window size in bytes.
+        pos: Current position in buffer.
+        signal_window: Window size for signal computation.
+        byte_window: Rolling byte statistics, slid to this position.
+        offset: Global offset of ``buffer[0]``.
+        gear_window: Rolling Gear hash, slid to this position and used for
+            K instead of the entropy. byte_window then only needs variance.
 
     Returns:
-        Shannon entropy in bits (0 to 8 for bytes).
+        Tuple of (K, S, D, B).
     """
-    end = min(start + window, len(buffer))
-    if end <= start:
-        return 0.0
+    start = max(0, pos - signal_window // 2)
 
-    window_bytes = buffer[start:end]
-    if len(window_bytes) == 0:
-        return 0.0
+    end = offset + max(start, min(start + signal_window, len(buffer)))
+    byte_window.slide(buffer, offset, offset + start, end)
 
-    # Count byte frequencies
-    counts: dict[int, int] = {}
-    for b in window_bytes:
-        counts[b] = counts.get(b, 0) + 1
+    # K: curvature proxy via entropy, or the Gear hash
+    if gear_window is None:
+        K = byte_window.entropy()
+    else:
+        gear_window.slide(buffer, offset, offset + start, end)
+        K = gear_window.curvature()
+    # S: stability margin proxy via inverse variance
+    variance = byte_window.variance()
 
-    # Compute entropy
-    total = len(window_bytes)
-    entropy = 0.0
-    for count in counts.values():
-        if count > 0:
-            p = count / total
-            entropy -= p * math.log2(p)
+    S = 8.0 / (1.0 + variance / 1000.0)
 
-    return entropy
+    # D: disharmony - disabled in v0.1
+    D = 0.0
+
+    # B: structural boundary (newline)
+    B = 1.0 if (pos < len(buffer) and buffer[pos] == 10) else 0.0
+
+    return K, S, D, B
 
 
-def _compute_byte_variance_buffer(buffer: bytearray, start: int, window: int) -> float:
-    """Compute variance of byte values in a buffer window.
+def _state_windows(
+    state: StreamingChunkerState,
+    signal_window: int,
+) -> tuple[_ByteWindow, _GearWindow | None]:
+    """Return the state's rolling windows, creating them on first use.
 
     Args:
-        buffer: The byte buffer.
-        start: Start position of the window.
-        window: Window size in bytes.
+        state: Current chunker state.
+        signal_window: Window size for signal computation.
 
     Returns:
-        Variance of byte values.
+        Tuple of (byte_window, gear_window); gear_window is None unless the
+        stream uses the "gear" curvature proxy, in which case byte_window
+        skips the entropy histogram.
     """
-    end = min(start + window, len(buffer))
-    if end <= start:
-        return 0.0
+    gear = state.curvature_proxy == "gear"
+    if state.byte_window is None or state.byte_window.window != signal_window:
+        state.byte_window = _ByteWindow(window=signal_window, track_entropy=not gear)
+    if not gear:
+        return state.byte_window, None
+    if state.gear_window is None or state.gear_window.window != signal_window:
+        state.gear_window = _GearWindow(window=signal_window)
+    return state.byte_window, state.gear_window
 
-    window_bytes = buffer[start:end]
-    if len(window_bytes) < 2:
-        return 0.0
 
-    # Compute mean
-    total = sum(window_bytes)
-    mean = total / len(window_bytes)
+def _state_signal_values(
+    state: StreamingChunkerState,
+    pos: int,
+    signal_window: int,
+) -> tuple[float, float, float, float]:
+    """Compute raw signal values at a buffer position using the state's window.
 
-    # Compute variance
-    variance = sum((b - mean) ** 2 for b in window_bytes) / len(window_bytes)
+    Args:
+        state: Current chunker state.
+        pos: Current position in buffer.
+        signal_window: Window size for signal computation.
 
-    return variance
+    Returns:
+        Tuple of (K, S, D, B).
+    """
+    byte_window, gear_window = _state_windows(state, signal_window)
+    return _signal_values_at_buffer_position(
+        state.buffer,
+        pos,
+        signal_window,
+        byte_window=byte_window,
+        offset=state.global_offset,
+        gear_window=gear_window,
+    )
 
 
-def _compute_signals_at_buffer_position(
-    buffer: bytearray,
+def _state_signals_at(
+    state: StreamingChunkerState,
     pos: int,
     chunk_length: int,
-    signal_window: int = 64,
+    signal_window: int,
 ) -> CutScoreSignals:
-    """Compute all signals at a given buffer position.
+    """Compute signals at a buffer position using the state's rolling window.
 
     Args:
-        buffer: The byte buffer.
+        state: Current chunker state.
         pos: Current position in buffer.
         chunk_length: Current chunk length from start.
         signal_window: Window size for signal computation.
@@ -151,30 +727,153 @@ def _compute_signals_at_buffer_position(
     Returns:
         CutScoreSignals at the position.
     """
-    # K: curvature proxy via entropy
-    K = _compute_byte_entropy_buffer(
-        buffer, max(0, pos - signal_window // 2), signal_window
-    )
+    K, S, D, B = _state_signal_values(state, pos, signal_window)
+    return CutScoreSignals(K=K, S=S, D=D, B=B, L=chunk_length)
 
-    # S: stability margin proxy via inverse variance
-    variance = _compute_byte_variance_buffer(
-        buffer, max(0, pos - signal_window // 2), signal_window
+
+def _range_signal_values(
+    state: StreamingChunkerState,
+    lo: int,
+    hi: int,
+    signal_window: int,
+) -> np.ndarray:
+    """Compute raw signals for buffer positions ``lo..hi`` in one sweep.
+
+    Args:
+        state: Current chunker state.
+        lo: First buffer position.
+        hi: Last buffer position (inclusive).
+        signal_window: Window size for signal computation.
+
+    Returns:
+        Array of shape (hi - lo + 1, 4) with (K, S, D, B) per position.
+    """
+    byte_window, gear_window = _state_windows(state, signal_window)
+    entropies, variances = byte_window.sweep(state.buffer, state.global_offset, lo, hi)
+
+    values = np.zeros((len(variances), 4), dtype=np.float64)
+    if gear_window is None:
+        values[:, 0] = entropies
+    else:
+        values[:, 0] = gear_window.sweep(state.buffer, state.global_offset, lo, hi)
+    # Same elementwise arithmetic as _signal_values_at_buffer_position()
+    values[:, 1] = 8.0 / (1.0 + np.asarray(variances, dtype=np.float64) / 1000.0)
+    # D stays 0.0 (disabled in v0.1); B marks newlines inside the buffer.
+    # The uint8 view is zero-copy and only lives for the comparison, so it
+    # never pins the bytearray against resizing.
+    count = max(0, min(hi + 1, len(state.buffer)) - lo)
+    values[:count, 3] = (
+        np.frombuffer(state.buffer, dtype=np.uint8, count=count, offset=lo) == 10
     )
-    S = 8.0 / (1.0 + variance / 1000.0)
+    return values
 
-    # D: disharmony - disabled in v0.1
-    D = 0.0
 
-    # B: structural boundary (newline)
-    B = 1.0 if (pos < len(buffer) and buffer[pos] == ord("\n")) else 0.0
+def _scan_signal_values(
+    state: StreamingChunkerState,
+    min_pos: int,
+    max_pos: int,
+    signal_window: int,
+) -> np.ndarray:
+    """Compute raw signals for every buffer position in a range.
 
-    return CutScoreSignals(K=K, S=S, D=D, B=B, L=chunk_length)
+    Sweeps the state's rolling byte window across the range, reusing raw
+    signals remembered from the previous scan where the ranges overlap.
+    Only positions whose window lies fully inside the buffer (so later data
+    cannot change it) are remembered for the next scan.
+
+    Args:
+        state: Current chunker state.
+        min_pos: First buffer position.
+        max_pos: Last buffer position (inclusive).
+        signal_window: Window size for signal computation.
+
+    Returns:
+        Array of shape (max_pos - min_pos + 1, 4) with (K, S, D, B) per
+        position.
+    """
+    half = signal_window // 2
+    last_complete = len(state.buffer) - signal_window + half
+    memo = state.scan_signals
+    memo_base = state.scan_signals_start - state.global_offset
+
+    # Remembered positions form one contiguous run inside the range
+    hit_lo = max(min_pos, memo_base, half)
+    hit_hi = min(max_pos, memo_base + len(memo) - 1)
+    if hit_lo > hit_hi:
+        values = _range_signal_values(state, min_pos, max_pos, signal_window)
+    else:
+        values = np.concatenate(
+            (
+                _range_signal_values(state, min_pos, hit_lo - 1, signal_window),
+                memo[hit_lo - memo_base : hit_hi - memo_base + 1],
+                _range_signal_values(state, hit_hi + 1, max_pos, signal_window),
+            )
+        )
+
+    first = max(min_pos, half)
+    stop = max(0, last_complete - min_pos + 1)
+    state.scan_signals = values[first - min_pos : stop]
+    state.scan_signals_start = state.global_offset + first
+    return values
+
+
+def _state_scorer(
+    state: StreamingChunkerState, config: ChunkingConfig
+) -> Callable[[NormalizedSignals], float]:
+    """Return the stream's specialized scorer, building it on first use.
+
+    Args:
+        state: Current chunker state.
+        config: Chunking configuration.
+
+    Returns:
+        Function mapping NormalizedSignals to the cut-score.
+    """
+    if state.scorer is None:
+        state.scorer = make_scorer(config)
+    return state.scorer
+
+
+def _score_signals(
+    state: StreamingChunkerState,
+    config: ChunkingConfig,
+    signals: CutScoreSignals,
+) -> tuple[float, NormalizedSignals]:
+    """Normalize signals with the stream's normalizers and score them.
+
+    Args:
+        state: Current chunker state.
+        config: Chunking configuration.
+        signals: Raw signals at the position.
+
+    Returns:
+        Tuple of (cut_score, normalized_signals).
+    """
+    norm = state.normalizers.normalize(signals)
+    return _state_scorer(state, config)(norm), norm
+
+
+def _check_curvature_proxy(curvature_proxy: str) -> None:
+    """Validate a curvature proxy name.
+
+    Args:
+        curvature_proxy: Name of the K signal to use.
+
+    Raises:
+        ValueError: If the name is not one of CURVATURE_PROXIES.
+    """
+    if curvature_proxy not in CURVATURE_PROXIES:
+        raise ValueError(
+            f"Unknown curvature proxy {curvature_proxy!r}, "
+            f"expected one of {CURVATURE_PROXIES}"
+        )
 
 
 def chunk_stream(
     data_iter: Iterator[bytes],
     config: ChunkingConfig,
     signal_window: int = 64,
+    curvature_proxy: str = "entropy",
 ) -> Iterator[Chunk]:
     """Stream chunks from an iterator of byte data.
 
@@ -187,12 +886,19 @@ def chunk_stream(
         data_iter: Iterator yielding bytes chunks.
         config: Chunking configuration.
         signal_window: Window size for signal computation.
+        curvature_proxy: Signal used for K: "entropy" (byte entropy, the
+            default) or "gear" (trailing zeros of a Gear rolling hash).
 
     Yields:
         Chunk objects as they are committed.
+
+    Raises:
+        ValueError: If curvature_proxy is not one of CURVATURE_PROXIES.
     """
+    _check_curvature_proxy(curvature_proxy)
     state = StreamingChunkerState(
-        normalizers=SignalNormalizers(window_size=config.commit_horizon_bytes)
+        normalizers=SignalNormalizers(window_size=config.commit_horizon_bytes),
+        curvature_proxy=curvature_proxy,
     )
 
     # Process incoming data
@@ -223,6 +929,9 @@ def _process_buffer(
     Yields:
         Chunk objects as they are ready.
     """
+    score_fn = _state_scorer(state, config)
+    norm_buf = NormalizedSignals()
+
     while True:
         buffer_len = len(state.buffer)
 
@@ -252,42 +961,41 @@ def _process_buffer(
         if chunk_length >= config.min_bytes:
             # Compute signals at current position
             pos = buffer_len - 1
-            signals = _compute_signals_at_buffer_position(
-                state.buffer, pos, chunk_length, signal_window
-            )
-            score, norm = compute_cut_score(signals, config, state.normalizers)
-
-            global_pos = state.global_offset + pos
+            signals = _state_signal_values(state, pos, signal_window)
+            K, S, D, B = signals
+            normalized = state.normalizers.update(K, S, D)
+            norm_buf.K_norm, norm_buf.S_norm, norm_buf.D_norm = normalized
+            norm_buf.B = B
+            norm_buf.L = chunk_length
+            score = score_fn(norm_buf)
 
             # Track this as a boundary candidate
-            candidate = BoundaryCandidate(
-                position=pos,
-                global_position=global_pos,
-                score=score,
-                signals=signals,
-                normalized_signals=norm,
+            slot = state.candidates.append(
+                pos,
+                state.global_offset + pos,
+                score,
+                signals,
+                normalized,
+                chunk_length,
             )
-            state.candidates.append(candidate)
 
             # Update best boundary if this is better
             if state.best_boundary is None or score > state.best_boundary.score:
-                state.best_boundary = candidate
-
-            # Check soft trigger
-            if score >= config.soft_trigger_threshold:
-                state.soft_trigger_count += 1
-
-                if state.soft_trigger_count >= config.soft_trigger_sustain_steps:
-                    # Soft trigger sustained - commit at best boundary
-                    chunk = _commit_at_boundary(
-                        state, state.best_boundary, config, signal_window
-                    )
-                    if chunk is not None:
-                        yield chunk
-                    continue
-            else:
-                # Reset soft trigger counter
-                state.soft_trigger_count = 0
+                state.best_boundary = state.candidates.candidate(slot)
+
+            # Check soft trigger: count consecutive steps above threshold,
+            # resetting to zero on a miss (count * 0) in a single update
+            hit = score >= config.soft_trigger_threshold
+            state.soft_trigger_count = (state.soft_trigger_count + hit) * hit
+
+            if hit and state.soft_trigger_count >= config.soft_trigger_sustain_steps:
+                # Soft trigger sustained - commit at best boundary
+                chunk = _commit_at_boundary(
+                    state, state.best_boundary, config, signal_window
+                )
+                if chunk is not None:
+                    yield chunk
+                continue
 
         # Not ready to commit - need more data
         break
@@ -317,43 +1025,46 @@ def _commit_chunk_at_best_boundary(
     min_pos = config.min_bytes
     max_pos = min(config.max_bytes, len(state.buffer))
 
-    best_candidate: BoundaryCandidate | None = None
-    best_score = float("-inf")
-
     # Check recent candidates
-    for candidate in state.candidates:
-        if min_pos <= candidate.position <= max_pos:
-            if candidate.score > best_score:
-                best_score = candidate.score
-                best_candidate = candidate
+    best_candidate = state.candidates.best_in_range(min_pos, max_pos)
 
     # If no good candidate, scan the range
-    if best_candidate is None:
-        for pos in range(min_pos, max_pos + 1):
-            chunk_length = pos
-            signals = _compute_signals_at_buffer_position(
-                state.buffer, pos, chunk_length, signal_window
+    if best_candidate is None and min_pos <= max_pos:
+        values = _scan_signal_values(state, min_pos, max_pos, signal_window)
+        K, S, D, B = values.T.tolist()
+
+        # Normalization is sequential; scoring runs over the whole range
+        K_norm, S_norm, D_norm = state.normalizers.normalize_many(K, S, D)
+        scores = score_normalized_arrays(
+            np.asarray(K_norm, dtype=np.float64),
+            np.asarray(S_norm, dtype=np.float64),
+            np.asarray(D_norm, dtype=np.float64),
+            values[:, 3],
+            np.arange(min_pos, max_pos + 1, dtype=np.float64),
+            config,
+        )
+
+        # First maximum wins; NaN and -inf never do (as with a ">" scan)
+        valid = scores > -np.inf
+        if valid.any():
+            i = int(np.where(valid, scores, -np.inf).argmax())
+            pos = min_pos + i
+            best_candidate = BoundaryCandidate(
+                position=pos,
+                global_position=state.global_offset + pos,
+                score=float(scores[i]),
+                signals=CutScoreSignals(K=K[i], S=S[i], D=D[i], B=B[i], L=pos),
+                normalized_signals=NormalizedSignals(
+                    K_norm=K_norm[i], S_norm=S_norm[i], D_norm=D_norm[i], B=B[i], L=pos
+                ),
             )
-            score, norm = compute_cut_score(signals, config, state.normalizers)
-
-            if score > best_score:
-                best_score = score
-                best_candidate = BoundaryCandidate(
-                    position=pos,
-                    global_position=state.global_offset + pos,
-                    score=score,
-                    signals=signals,
-                    normalized_signals=norm,
-                )
 
     # Fall back to max_bytes if still no candidate
     if best_candidate is None:
         pos = max_pos
         chunk_length = pos
-        signals = _compute_signals_at_buffer_position(
-            state.buffer, pos, chunk_length, signal_window
-        )
-        score, norm = compute_cut_score(signals, config, state.normalizers)
+        signals = _state_signals_at(state, pos, chunk_length, signal_window)
+        score, norm = _score_signals(state, config, signals)
         best_candidate = BoundaryCandidate(
             position=pos,
             global_position=state.global_offset + pos,
@@ -393,8 +1104,9 @@ def _commit_at_boundary(
     if end_pos <= 0:
         return None
 
-    # Extract chunk content
-    content = bytes(state.buffer[:end_pos])
+    # Extract chunk content (copy once through a view, not via a bytearray slice)
+    with memoryview(state.buffer) as view:
+        content = bytes(view[:end_pos])
 
     # Create chunk
     chunk = Chunk(
@@ -444,10 +1156,16 @@ def _commit_remaining(
     pos = len(state.buffer)
     chunk_length = pos
 
-    signals = _compute_signals_at_buffer_position(
-        state.buffer, pos - 1, chunk_length, signal_window
-    )
-    score, norm = compute_cut_score(signals, config, state.normalizers)
+    # If the last step already scored the final byte, no data has arrived
+    # since, so its raw signals still hold; only normalization is redone
+    ring = state.candidates
+    slot = ring.latest()
+    if slot >= 0 and ring.positions[slot] == pos - 1:
+        K, S, D, B = ring.signals[slot].tolist()
+        signals = CutScoreSignals(K=K, S=S, D=D, B=B, L=chunk_length)
+    else:
+        signals = _state_signals_at(state, pos - 1, chunk_length, signal_window)
+    score, norm = _score_signals(state, config, signals)
 
     content = bytes(state.buffer)
 
@@ -490,17 +1208,25 @@ class StreamingChunker:
         self,
         config: ChunkingConfig,
         signal_window: int = 64,
+        curvature_proxy: str = "entropy",
     ) -> None:
         """Initialize the streaming chunker.
 
         Args:
             config: Chunking configuration.
             signal_window: Window size for signal computation.
+            curvature_proxy: Signal used for K, one of CURVATURE_PROXIES.
+
+        Raises:
+            ValueError: If curvature_proxy is not one of CURVATURE_PROXIES.
         """
+        _check_curvature_proxy(curvature_proxy)
         self.config = config
         self.signal_window = signal_window
+        self.curvature_proxy = curvature_proxy
         self.state = StreamingChunkerState(
-            normalizers=SignalNormalizers(window_size=config.commit_horizon_bytes)
+            normalizers=SignalNormalizers(window_size=config.commit_horizon_bytes),
+            curvature_proxy=curvature_proxy,
         )
         self._finalized = False
 
@@ -546,7 +1272,8 @@ class StreamingChunker:
     def reset(self) -> None:
         """Reset the chunker state for reuse."""
         self.state = StreamingChunkerState(
-            normalizers=SignalNormalizers(window_size=self.config.commit_horizon_bytes)
+            normalizers=SignalNormalizers(window_size=self.config.commit_horizon_bytes),
+            curvature_proxy=self.curvature_proxy,
         )
         self._finalized = False
 
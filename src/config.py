@@ -2,6 +2,11 @@
 Configuration loader for curv-embedding.
 
 Provides typed configuration access with validation and manifest generation.
+
+All configuration dataclasses are frozen: a loaded configuration is an
+immutable snapshot, so derived values (the dictionary view and the config
+hash) are computed once and memoized. Use ``dataclasses.replace`` or
+``Config.with_updates`` to derive a modified configuration.
 """
 
 from __future__ import annotations
@@ -9,12 +14,12 @@ from __future__ import annotations
 import hashlib
 import json
 import tomllib
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any
 
 
-@dataclass
+@dataclass(frozen=True)
 class ChunkingConfig:
     """Chunking algorithm parameters."""
 
@@ -47,7 +52,7 @@ class ChunkingConfig:
     soft_trigger_sustain_steps: int = 3
 
 
-@dataclass
+@dataclass(frozen=True)
 class HybridConfig:
     """Hybrid chunking parameters.
 
@@ -61,7 +66,7 @@ class HybridConfig:
     guard_band_bytes: int = 256
 
 
-@dataclass
+@dataclass(frozen=True)
 class EmbeddingConfig:
     """Embedding model parameters."""
 
@@ -71,8 +76,38 @@ class EmbeddingConfig:
     batch_size: int = 32
     normalize: bool = True
 
+    # Inference options (non-default values trade bitwise reproducibility
+    # for speed; see EmbeddingModel)
+    backend: str = "torch"  # torch, onnx
+    quantization: str | None = None  # ONNX int8: arm64, avx2, avx512, avx512_vnni
+    cache_dir: str = ".cache/onnx"  # exported quantized ONNX models
+    precision: str = "fp32"  # fp32, fp16, bf16 (PyTorch on CUDA only)
+    num_threads: int | None = None  # PyTorch CPU threads; None for its default
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to the dictionary recorded in manifests and hashed.
+
+        Inference options appear only when changed from their defaults, so
+        reference runs keep the config hash they had before the options
+        existed. cache_dir is a local path, not part of an experiment's
+        identity, and is never included.
+        """
+        d = dict(self.__dict__)
+        del d["cache_dir"]
+        for name in _EMBEDDING_RUNTIME_FIELDS:
+            if d[name] == _EMBEDDING_RUNTIME_DEFAULTS[name]:
+                del d[name]
+        return d
+
 
-@dataclass
+# Inference options omitted from EmbeddingConfig.to_dict() at their defaults
+_EMBEDDING_RUNTIME_FIELDS = ("backend", "quantization", "precision", "num_threads")
+_EMBEDDING_RUNTIME_DEFAULTS = {
+    name: getattr(EmbeddingConfig, name) for name in _EMBEDDING_RUNTIME_FIELDS
+}
+
+
+@dataclass(frozen=True)
 class StorageConfig:
     """Storage backend parameters."""
 
@@ -83,7 +118,7 @@ class StorageConfig:
     faiss_metric: str = "L2"
 
 
-@dataclass
+@dataclass(frozen=True)
 class EvalConfig:
     """Evaluation parameters."""
 
@@ -95,7 +130,7 @@ class EvalConfig:
     reformulations_per_family: int = 10
 
 
-@dataclass
+@dataclass(frozen=True)
 class BaselineConfig:
     """Baseline chunking parameters for comparison."""
 
@@ -104,7 +139,7 @@ class BaselineConfig:
     fixed_overlap_bytes: int = 64
 
 
-@dataclass
+@dataclass(frozen=True)
 class DiagnosticsConfig:
     """Diagnostic signal mode configuration.
 
@@ -116,7 +151,7 @@ class DiagnosticsConfig:
     description: str = "v1.0.0 baseline uses proxy diagnostics: K=byte_entropy, S=inverse_variance, B=newlines"
 
 
-@dataclass
+@dataclass(frozen=True)
 class RerankConfig:
     """Representational reranking configuration.
 
@@ -135,7 +170,7 @@ class RerankConfig:
     seed: int = 1337
 
 
-@dataclass
+@dataclass(frozen=True)
 class GeneralConfig:
     """General experiment parameters."""
 
@@ -144,7 +179,7 @@ class GeneralConfig:
     log_level: str = "INFO"
 
 
-@dataclass
+@dataclass(frozen=True)
 class Config:
     """Complete experiment configuration."""
 
@@ -158,6 +193,14 @@ class Config:
     diagnostics: DiagnosticsConfig = field(default_factory=DiagnosticsConfig)
     rerank: RerankConfig = field(default_factory=RerankConfig)
 
+    # Memoized derived values (populated lazily, excluded from eq/repr)
+    _cached_dict: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _cached_hash: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     @classmethod
     def from_toml(cls, path: str | Path) -> Config:
         """Load configuration from TOML file."""
@@ -181,24 +224,46 @@ class Config:
             rerank=RerankConfig(**data.get("rerank", {})),
         )
 
+    def with_updates(self, **sections: Any) -> Config:
+        """Return a copy of this configuration with sections replaced.
+
+        Args:
+            **sections: Section name to replacement section dataclass,
+                e.g. ``chunking=replace(config.chunking, min_bytes=128)``.
+
+        Returns:
+            New Config with fresh (empty) memoization caches.
+        """
+        return replace(self, **sections)
+
     def to_dict(self) -> dict[str, Any]:
-        """Convert configuration to dictionary."""
-        return {
-            "general": self.general.__dict__,
-            "chunking": self.chunking.__dict__,
-            "hybrid": self.hybrid.__dict__,
-            "embedding": self.embedding.__dict__,
-            "storage": self.storage.__dict__,
-            "eval": self.eval.__dict__,
-            "baseline": self.baseline.__dict__,
-            "diagnostics": self.diagnostics.__dict__,
-            "rerank": self.rerank.__dict__,
-        }
+        """Convert configuration to dictionary.
+
+        The result is memoized and shared between calls; treat it as
+        read-only.
+        """
+        if self._cached_dict is None:
+            object.__setattr__(self, "_cached_dict", {
+                "general": dict(self.general.__dict__),
+                "chunking": dict(self.chunking.__dict__),
+                "hybrid": dict(self.hybrid.__dict__),
+                "embedding": self.embedding.to_dict(),
+                "storage": dict(self.storage.__dict__),
+                "eval": dict(self.eval.__dict__),
+                "baseline": dict(self.baseline.__dict__),
+                "diagnostics": dict(self.diagnostics.__dict__),
+                "rerank": dict(self.rerank.__dict__),
+            })
+        return self._cached_dict
 
     def config_hash(self) -> str:
-        """Compute deterministic hash of configuration."""
-        config_str = json.dumps(self.to_dict(), sort_keys=True)
-        return hashlib.sha256(config_str.encode()).hexdigest()[:16]
+        """Compute deterministic hash of configuration (memoized)."""
+        if self._cached_hash is None:
+            config_str = json.dumps(self.to_dict(), sort_keys=True)
+            object.__setattr__(
+                self, "_cached_hash", hashlib.sha256(config_str.encode()).hexdigest()[:16]
+            )
+        return self._cached_hash
 
     def to_manifest(self) -> dict[str, Any]:
         """Generate manifest entry for this configuration."""
@@ -208,8 +273,23 @@ class Config:
         }
 
 
+# Parsed configurations keyed by (resolved path, mtime_ns, size). Config is
+# frozen, so a cached instance can be shared by every caller.
+_CONFIG_CACHE: dict[tuple[Path, int, int], Config] = {}
+
+
 def load_config(path: str | Path | None = None) -> Config:
-    """Load configuration from file or return defaults."""
+    """Load configuration from file or return defaults.
+
+    Files are parsed once per process and reused until their modification
+    time or size changes.
+    """
     if path is None:
         return Config()
-    return Config.from_toml(path)
+    path = Path(path).resolve()
+    stat = path.stat()
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    config = _CONFIG_CACHE.get(key)
+    if config is None:
+        config = _CONFIG_CACHE[key] = Config.from_toml(path)
+    return config
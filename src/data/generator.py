@@ -9,6 +9,8 @@ from __future__ import annotations
 
 import random
 import string
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 
 
@@ -31,6 +33,11 @@ class SyntheticDocument:
     planted_anchors: list[tuple[int, int, str]] = field(default_factory=list)
 
 
+# Every generator below emits ASCII only, so a string's len() is its size
+# in bytes; documents track sizes on the strings and encode once at the end.
+# Boundary offsets are appended in increasing order, so trimming them to a
+# size is a binary search.
+
 # Markov-like word generation data for realistic text
 _WORD_STARTS = "bcdfghjklmnpqrstvwxyz"
 _VOWELS = "aeiou"
@@ -62,20 +69,40 @@ _LOG_ACTIONS = [
 ]
 
 
+# (letters, count, bit length of count) per letter class, for drawing indices
+# the way random.Random.choice() does: getrandbits(k) with rejection of
+# values >= count. Same draws and results as rng.choice(), without the two
+# Python-level calls per letter.
+_VOWEL_DRAW = (_VOWELS, len(_VOWELS), len(_VOWELS).bit_length())
+_START_DRAW = (_WORD_STARTS, len(_WORD_STARTS), len(_WORD_STARTS).bit_length())
+_END_DRAW = (_WORD_ENDS, len(_WORD_ENDS), len(_WORD_ENDS).bit_length())
+
+
 def _generate_word(rng: random.Random, min_len: int = 2, max_len: int = 10) -> str:
     """Generate a pronounceable pseudo-word."""
-    length = rng.randint(min_len, max_len)
+    getrandbits = rng.getrandbits
+    # rng.randint(min_len, max_len), drawn the same way
+    width = max_len - min_len + 1
+    k = width.bit_length()
+    r = getrandbits(k)
+    while r >= width:
+        r = getrandbits(k)
+    length = min_len + r
     word = []
     use_vowel = rng.random() < 0.3  # Sometimes start with vowel
+    last = length - 1
 
     for i in range(length):
         if use_vowel:
-            word.append(rng.choice(_VOWELS))
+            letters, n, k = _VOWEL_DRAW
+        elif i == last:
+            letters, n, k = _END_DRAW
         else:
-            if i == length - 1:
-                word.append(rng.choice(_WORD_ENDS))
-            else:
-                word.append(rng.choice(_WORD_STARTS))
+            letters, n, k = _START_DRAW
+        r = getrandbits(k)
+        while r >= n:
+            r = getrandbits(k)
+        word.append(letters[r])
         use_vowel = not use_vowel
 
     return "".join(word)
@@ -88,9 +115,8 @@ def _generate_sentence(rng: random.Random, min_words: int = 5, max_words: int =
     words[0] = words[0].capitalize()
 
     # Occasionally insert commas
-    for i in range(1, len(words) - 1):
-        if rng.random() < 0.15:
-            words[i] = words[i] + ","
+    rand = rng.random
+    words[1:-1] = [w + "," if rand() < 0.15 else w for w in words[1:-1]]
 
     # End punctuation
     end_punct = rng.choice([".", ".", ".", "!", "?"])
@@ -116,8 +142,8 @@ def _generate_identifier(rng: random.Random) -> str:
         return parts[0] + "".join(p.capitalize() for p in parts[1:])
 
 
-def _generate_function(rng: random.Random, indent: int = 0) -> str:
-    """Generate a function-like code structure."""
+def _generate_function(rng: random.Random, out: list[str], indent: int = 0) -> None:
+    """Append the lines of a function-like code structure to ``out``."""
     prefix = " " * indent
     name = _generate_identifier(rng)
     num_params = rng.randint(0, 4)
@@ -135,14 +161,15 @@ def _generate_function(rng: random.Random, indent: int = 0) -> str:
     signature = f"{prefix}def {name}({', '.join(typed_params)})"
     if return_type:
         signature += f" -> {return_type}"
-    signature += ":\n"
+    signature += ":"
+    out.append(signature)
+    out.append("")  # Blank line after the signature
 
     # Docstring sometimes
-    lines = [signature]
     if rng.random() < 0.6:
-        lines.append(f'{prefix}    """')
-        lines.append(f"{prefix}    {_generate_sentence(rng, 3, 10)}")
-        lines.append(f'{prefix}    """')
+        out.append(f'{prefix}    """')
+        out.append(f"{prefix}    {_generate_sentence(rng, 3, 10)}")
+        out.append(f'{prefix}    """')
 
     # Body
     body_lines = rng.randint(2, 8)
@@ -151,64 +178,67 @@ def _generate_function(rng: random.Random, indent: int = 0) -> str:
         if line_type == "assign":
             var = _generate_identifier(rng)
             val = rng.choice([str(rng.randint(0, 100)), f'"{_generate_word(rng)}"', "None", "[]", "{}"])
-            lines.append(f"{prefix}    {var} = {val}")
+            out.append(f"{prefix}    {var} = {val}")
         elif line_type == "call":
             func = _generate_identifier(rng)
             args = ", ".join(_generate_identifier(rng) for _ in range(rng.randint(0, 3)))
-            lines.append(f"{prefix}    {func}({args})")
+            out.append(f"{prefix}    {func}({args})")
         elif line_type == "if":
             cond = f"{_generate_identifier(rng)} {rng.choice(['>', '<', '==', '!=', 'is'])} {rng.choice(['None', '0', 'True'])}"
-            lines.append(f"{prefix}    if {cond}:")
-            lines.append(f"{prefix}        pass")
+            out.append(f"{prefix}    if {cond}:")
+            out.append(f"{prefix}        pass")
         elif line_type == "return":
-            lines.append(f"{prefix}    return {_generate_identifier(rng)}")
+            out.append(f"{prefix}    return {_generate_identifier(rng)}")
             break
         else:  # comment
-            lines.append(f"{prefix}    # {_generate_sentence(rng, 3, 8)}")
-
-    if not lines[-1].strip().startswith("return"):
-        lines.append(f"{prefix}    return None")
+            out.append(f"{prefix}    # {_generate_sentence(rng, 3, 8)}")
 
-    return "\n".join(lines) + "\n"
+    if not out[-1].strip().startswith("return"):
+        out.append(f"{prefix}    return None")
 
 
-def _generate_class(rng: random.Random) -> str:
-    """Generate a class-like code structure."""
+def _generate_class(rng: random.Random, out: list[str]) -> None:
+    """Append the lines of a class-like code structure to ``out``."""
     name = "".join(rng.choice(_CODE_NAMES).capitalize() for _ in range(rng.randint(1, 2)))
-    lines = [f"class {name}:"]
+    out.append(f"class {name}:")
 
     # Docstring
     if rng.random() < 0.7:
-        lines.append('    """')
-        lines.append(f"    {_generate_sentence(rng, 3, 10)}")
-        lines.append('    """')
+        out.append('    """')
+        out.append(f"    {_generate_sentence(rng, 3, 10)}")
+        out.append('    """')
 
     # Methods
     num_methods = rng.randint(1, 4)
     for i in range(num_methods):
         if i == 0:
             # __init__ method
-            lines.append("")
-            lines.append("    def __init__(self):")
-            lines.append(f"        self.{_generate_identifier(rng)} = None")
+            out.append("")
+            out.append("    def __init__(self):")
+            out.append(f"        self.{_generate_identifier(rng)} = None")
         else:
-            lines.append("")
-            lines.append(_generate_function(rng, indent=4))
+            out.append("")
+            _generate_function(rng, out, indent=4)
+            out.append("")  # Methods end with a blank line
+
 
-    return "\n".join(lines) + "\n"
+# JSON value kinds and literals, drawn with rng.choice()
+_JSON_LEAF_KINDS = ("string", "number", "bool", "null")
+_JSON_VALUE_KINDS = ("string", "number", "bool", "null", "array", "object")
+_JSON_BOOLS = ("true", "false")
 
 
 def _generate_json_object(rng: random.Random, depth: int = 0) -> str:
     """Generate a JSON-like object."""
     if depth > 2:
         # Leaf values only at max depth
-        val_type = rng.choice(["string", "number", "bool", "null"])
+        val_type = rng.choice(_JSON_LEAF_KINDS)
         if val_type == "string":
             return f'"{_generate_word(rng)}"'
         elif val_type == "number":
             return str(rng.randint(0, 10000) if rng.random() < 0.7 else round(rng.random() * 1000, 2))
         elif val_type == "bool":
-            return rng.choice(["true", "false"])
+            return rng.choice(_JSON_BOOLS)
         else:
             return "null"
 
@@ -219,14 +249,14 @@ def _generate_json_object(rng: random.Random, depth: int = 0) -> str:
 
     for _ in range(num_fields):
         key = _generate_identifier(rng)
-        val_type = rng.choice(["string", "number", "bool", "null", "array", "object"])
+        val_type = rng.choice(_JSON_VALUE_KINDS)
 
         if val_type == "string":
             value = f'"{_generate_word(rng)}"'
         elif val_type == "number":
             value = str(rng.randint(0, 10000) if rng.random() < 0.7 else round(rng.random() * 1000, 2))
         elif val_type == "bool":
-            value = rng.choice(["true", "false"])
+            value = rng.choice(_JSON_BOOLS)
         elif val_type == "null":
             value = "null"
         elif val_type == "array":
@@ -241,10 +271,35 @@ def _generate_json_object(rng: random.Random, depth: int = 0) -> str:
     return "{\n" + ",\n".join(fields) + f"\n{close_indent}}}"
 
 
+# Log fields as (choices, count, bit length of count) for getrandbits draws
+# matching rng.choice(), with level and component pre-padded into their tags.
+_LOG_LEVEL_DRAW = (
+    tuple(f"[{level:5}]" for level in _LOG_LEVELS),
+    len(_LOG_LEVELS),
+    len(_LOG_LEVELS).bit_length(),
+)
+_LOG_COMPONENT_DRAW = (
+    tuple(f"[{component:10}]" for component in _LOG_COMPONENTS),
+    len(_LOG_COMPONENTS),
+    len(_LOG_COMPONENTS).bit_length(),
+)
+_LOG_ACTION_DRAW = (
+    tuple(_LOG_ACTIONS),
+    len(_LOG_ACTIONS),
+    len(_LOG_ACTIONS).bit_length(),
+)
+_LOG_STYLE_DRAW = (("simple", "key_value", "detailed"), 3, 2)
+
+
 def _generate_log_line(rng: random.Random, timestamp_base: int) -> tuple[str, int]:
     """Generate a log line with timestamp. Returns (line, next_timestamp)."""
-    # Increment timestamp by 1-5000ms
-    timestamp = timestamp_base + rng.randint(1, 5000)
+    getrandbits = rng.getrandbits
+
+    # Increment timestamp by 1-5000ms (rng.randint(1, 5000), drawn the same way)
+    r = getrandbits(13)
+    while r >= 5000:
+        r = getrandbits(13)
+    timestamp = timestamp_base + 1 + r
 
     # Format: ISO-like timestamp
     hours = (timestamp // 3600000) % 24
@@ -253,12 +308,18 @@ def _generate_log_line(rng: random.Random, timestamp_base: int) -> tuple[str, in
     millis = timestamp % 1000
     ts_str = f"2024-01-15T{hours:02d}:{minutes:02d}:{seconds:02d}.{millis:03d}Z"
 
-    level = rng.choice(_LOG_LEVELS)
-    component = rng.choice(_LOG_COMPONENTS)
-    action = rng.choice(_LOG_ACTIONS)
+    # Level, component, action and message style, as rng.choice() would pick
+    picks = []
+    for choices, n, k in (
+        _LOG_LEVEL_DRAW, _LOG_COMPONENT_DRAW, _LOG_ACTION_DRAW, _LOG_STYLE_DRAW
+    ):
+        r = getrandbits(k)
+        while r >= n:
+            r = getrandbits(k)
+        picks.append(choices[r])
+    level_tag, component_tag, action, msg_style = picks
 
     # Generate message
-    msg_style = rng.choice(["simple", "key_value", "detailed"])
     if msg_style == "simple":
         message = f"{action} {_generate_word(rng)}"
     elif msg_style == "key_value":
@@ -267,7 +328,7 @@ def _generate_log_line(rng: random.Random, timestamp_base: int) -> tuple[str, in
     else:
         message = f"{action}: {_generate_sentence(rng, 3, 8)}"
 
-    line = f"[{ts_str}] [{level:5}] [{component:10}] {message}\n"
+    line = f"[{ts_str}] {level_tag} {component_tag} {message}\n"
     return line, timestamp
 
 
@@ -284,7 +345,7 @@ def generate_text_document(seed: int, size_bytes: int) -> SyntheticDocument:
     rng = random.Random(seed)
     doc_id = f"text_{seed:08x}"
 
-    paragraphs = []
+    buf = bytearray()
     boundaries = []
     anchors = []
     current_size = 0
@@ -301,26 +362,25 @@ def generate_text_document(seed: int, size_bytes: int) -> SyntheticDocument:
             anchors.append((anchor_start, anchor_end, anchor_id))
             anchor_counter += 1
 
-        paragraphs.append(para)
-        current_size += len(para.encode("utf-8"))
+        if boundaries:
+            buf += b"\n\n"
+        buf += para.encode("utf-8")
+        current_size += len(para)
 
         # Mark paragraph boundary (before the newlines)
         boundaries.append(current_size)
         current_size += 2  # For "\n\n"
 
-    content = "\n\n".join(paragraphs)
-
     # Trim if over size
-    content_bytes = content.encode("utf-8")
-    if len(content_bytes) > size_bytes:
-        content_bytes = content_bytes[:size_bytes]
+    if len(buf) > size_bytes:
+        del buf[size_bytes:]
         # Adjust boundaries to be within content
-        boundaries = [b for b in boundaries if b < size_bytes]
+        boundaries = boundaries[:bisect_left(boundaries, size_bytes)]
         anchors = [(s, e, aid) for s, e, aid in anchors if e < size_bytes]
 
     return SyntheticDocument(
         doc_id=doc_id,
-        content=content_bytes,
+        content=bytes(buf),
         domain="text",
         boundary_offsets=boundaries,
         planted_anchors=anchors,
@@ -340,63 +400,66 @@ def generate_code_document(seed: int, size_bytes: int) -> SyntheticDocument:
     rng = random.Random(seed)
     doc_id = f"code_{seed:08x}"
 
-    blocks = []
+    # Every entry of lines is followed by a newline in the content
+    lines = []
     boundaries = []
     anchors = []
     current_size = 0
     anchor_counter = 0
 
     # Add imports at the start
-    imports = [
-        "from __future__ import annotations\n",
-        "import os\n",
-        "import sys\n",
-        f"from typing import {', '.join(rng.sample(_CODE_TYPES, 3))}\n",
-        "\n",
-    ]
-    header = "".join(imports)
-    blocks.append(header)
-    current_size = len(header.encode("utf-8"))
+    lines.extend([
+        "from __future__ import annotations",
+        "import os",
+        "import sys",
+        f"from typing import {', '.join(rng.sample(_CODE_TYPES, 3))}",
+        "",
+    ])
+    current_size = sum(map(len, lines)) + len(lines)
     boundaries.append(current_size)
 
     while current_size < size_bytes:
+        block_start = len(lines)
+
         # Alternate between functions and classes
         if rng.random() < 0.3:
-            block = _generate_class(rng)
+            _generate_class(rng, lines)
         else:
-            block = _generate_function(rng)
+            _generate_function(rng, lines)
 
-        block += "\n"  # Extra newline between blocks
-        block_bytes = block.encode("utf-8")
+        lines.append("")  # Extra newline between blocks
+        block_lines = lines[block_start:]
+        block_size = sum(map(len, block_lines)) + len(block_lines)
 
         # Plant anchor in function/class body
-        if rng.random() < 0.25 and len(block_bytes) > 100:
-            # Find a line in the middle
-            lines = block.split("\n")
-            if len(lines) > 4:
-                anchor_line_idx = rng.randint(2, len(lines) - 2)
-                line_start = sum(len(l) + 1 for l in lines[:anchor_line_idx])
+        if rng.random() < 0.25 and block_size > 100:
+            # Find a line in the middle; the block's text also splits into an
+            # empty line after its final newline
+            num_lines = len(block_lines) + 1
+            if num_lines > 4:
+                anchor_line_idx = rng.randint(2, num_lines - 2)
+                line_start = sum(map(len, block_lines[:anchor_line_idx])) + anchor_line_idx
                 anchor_start = current_size + line_start
-                anchor_end = anchor_start + len(lines[anchor_line_idx])
+                anchor_end = anchor_start + len(block_lines[anchor_line_idx])
                 anchor_id = f"{doc_id}_anchor_{anchor_counter:04d}"
                 anchors.append((anchor_start, anchor_end, anchor_id))
                 anchor_counter += 1
 
-        blocks.append(block)
-        current_size += len(block_bytes)
+        current_size += block_size
         boundaries.append(current_size)
 
-    content = "".join(blocks)
-    content_bytes = content.encode("utf-8")
+    lines.append("")  # Newline after the last line
+    content = "\n".join(lines)
 
-    if len(content_bytes) > size_bytes:
-        content_bytes = content_bytes[:size_bytes]
-        boundaries = [b for b in boundaries if b < size_bytes]
+    # ASCII, so trimming characters trims bytes without splitting any
+    if len(content) > size_bytes:
+        content = content[:size_bytes]
+        boundaries = boundaries[:bisect_left(boundaries, size_bytes)]
         anchors = [(s, e, aid) for s, e, aid in anchors if e < size_bytes]
 
     return SyntheticDocument(
         doc_id=doc_id,
-        content=content_bytes,
+        content=content.encode("utf-8"),
         domain="code",
         boundary_offsets=boundaries,
         planted_anchors=anchors,
@@ -416,7 +479,7 @@ def generate_json_document(seed: int, size_bytes: int) -> SyntheticDocument:
     rng = random.Random(seed)
     doc_id = f"json_{seed:08x}"
 
-    objects = []
+    buf = bytearray(b"[\n")
     boundaries = []
     anchors = []
     current_size = 1  # Opening bracket
@@ -424,32 +487,32 @@ def generate_json_document(seed: int, size_bytes: int) -> SyntheticDocument:
 
     while current_size < size_bytes - 10:  # Leave room for closing
         obj = _generate_json_object(rng)
-        obj_bytes = obj.encode("utf-8")
 
         # Plant anchor in object
-        if rng.random() < 0.2 and len(obj_bytes) > 50:
+        if rng.random() < 0.2 and len(obj) > 50:
             # Pick a position inside the object
-            anchor_offset = rng.randint(10, len(obj_bytes) - 20)
+            anchor_offset = rng.randint(10, len(obj) - 20)
             anchor_start = current_size + anchor_offset
-            anchor_end = anchor_start + rng.randint(15, min(50, len(obj_bytes) - anchor_offset - 5))
+            anchor_end = anchor_start + rng.randint(15, min(50, len(obj) - anchor_offset - 5))
             anchor_id = f"{doc_id}_anchor_{anchor_counter:04d}"
             anchors.append((anchor_start, anchor_end, anchor_id))
             anchor_counter += 1
 
-        objects.append(obj)
-        current_size += len(obj_bytes)
+        if boundaries:
+            buf += b",\n"
+        buf += obj.encode("utf-8")
+        current_size += len(obj)
         boundaries.append(current_size)
         current_size += 2  # For ",\n"
 
-    # Build final JSON array
-    content = "[\n" + ",\n".join(objects) + "\n]"
-    content_bytes = content.encode("utf-8")
+    # Close the JSON array
+    buf += b"\n]"
 
-    if len(content_bytes) > size_bytes:
-        content_bytes = content_bytes[:size_bytes]
+    if len(buf) > size_bytes:
+        del buf[size_bytes:]
         # Ensure valid JSON by finding last complete object
         # This is a simplification - real impl would be more careful
-        boundaries = [b for b in boundaries if b < size_bytes]
+        boundaries = boundaries[:bisect_left(boundaries, size_bytes)]
         anchors = [(s, e, aid) for s, e, aid in anchors if e < size_bytes]
 
     # Adjust boundaries for the opening "[\n"
@@ -457,7 +520,7 @@ def generate_json_document(seed: int, size_bytes: int) -> SyntheticDocument:
 
     return SyntheticDocument(
         doc_id=doc_id,
-        content=content_bytes,
+        content=bytes(buf),
         domain="json",
         boundary_offsets=boundaries,
         planted_anchors=anchors,
@@ -477,7 +540,7 @@ def generate_log_document(seed: int, size_bytes: int) -> SyntheticDocument:
     rng = random.Random(seed)
     doc_id = f"logs_{seed:08x}"
 
-    lines = []
+    buf = bytearray()
     boundaries = []
     anchors = []
     current_size = 0
@@ -486,50 +549,80 @@ def generate_log_document(seed: int, size_bytes: int) -> SyntheticDocument:
 
     while current_size < size_bytes:
         line, timestamp = _generate_log_line(rng, timestamp)
-        line_bytes = line.encode("utf-8")
 
         # Plant anchor on interesting log lines (ERROR/FATAL)
         if rng.random() < 0.15:
             anchor_start = current_size + 30  # After timestamp
-            anchor_end = current_size + len(line_bytes) - 1
+            anchor_end = current_size + len(line) - 1
             anchor_id = f"{doc_id}_anchor_{anchor_counter:04d}"
             anchors.append((anchor_start, anchor_end, anchor_id))
             anchor_counter += 1
 
-        lines.append(line)
-        current_size += len(line_bytes)
+        buf += line.encode("utf-8")
+        current_size += len(line)
         boundaries.append(current_size)
 
-    content = "".join(lines)
-    content_bytes = content.encode("utf-8")
-
-    if len(content_bytes) > size_bytes:
-        content_bytes = content_bytes[:size_bytes]
-        boundaries = [b for b in boundaries if b < size_bytes]
+    if len(buf) > size_bytes:
+        del buf[size_bytes:]
+        boundaries = boundaries[:bisect_left(boundaries, size_bytes)]
         anchors = [(s, e, aid) for s, e, aid in anchors if e < size_bytes]
 
     return SyntheticDocument(
         doc_id=doc_id,
-        content=content_bytes,
+        content=bytes(buf),
         domain="logs",
         boundary_offsets=boundaries,
         planted_anchors=anchors,
     )
 
 
+# Document generators by domain name. Workers look generators up by name so
+# corpus jobs stay plain picklable tuples.
+_GENERATORS = {
+    "text": generate_text_document,
+    "code": generate_code_document,
+    "json": generate_json_document,
+    "logs": generate_log_document,
+}
+
+# Per-domain offsets mixed into corpus document seeds. Fixed values rather
+# than hash(domain), which is salted per interpreter (PYTHONHASHSEED).
+_DOMAIN_SEED_SALT = {"text": 131, "code": 277, "json": 419, "logs": 557}
+
+# Corpora smaller than this are generated in-process; below it, starting
+# worker processes costs more than parallel generation saves.
+_PARALLEL_CORPUS_MIN_DOCS = 8
+
+
+def _generate_one(job: tuple[str, int, int]) -> SyntheticDocument:
+    """Generate one corpus document from a (domain, seed, size) job."""
+    domain, doc_seed, doc_size = job
+    return _GENERATORS[domain](doc_seed, doc_size)
+
+
 def generate_corpus(
     seed: int,
     num_docs: int,
     domains: list[str],
     size_range: tuple[int, int],
+    workers: int | None = None,
 ) -> list[SyntheticDocument]:
     """Generate a corpus of synthetic documents.
 
+    Domains, sizes and per-document seeds are drawn from the master RNG up
+    front; the documents themselves are independent, so they can be
+    generated in worker processes and the result does not depend on the
+    number of workers.
+
     Args:
         seed: Random seed for reproducibility.
         num_docs: Number of documents to generate.
         domains: List of domains to sample from (text/code/json/logs).
         size_range: (min_bytes, max_bytes) tuple for document sizes.
+        workers: Number of worker processes, e.g. os.cpu_count(). None (the
+            default) or 1 generates in-process. Parallel generation starts a
+            process pool, so callers using the spawn start method need an
+            ``if __name__ == "__main__"`` guard.
 
     Returns:
         List of SyntheticDocument instances.
@@ -537,28 +630,31 @@ def generate_corpus(
     rng = random.Random(seed)
     min_size, max_size = size_range
 
-    generators = {
-        "text": generate_text_document,
-        "code": generate_code_document,
-        "json": generate_json_document,
-        "logs": generate_log_document,
-    }
-
     # Validate domains
-    valid_domains = [d for d in domains if d in generators]
+    valid_domains = [d for d in domains if d in _GENERATORS]
     if not valid_domains:
-        raise ValueError(f"No valid domains provided. Must be from: {list(generators.keys())}")
+        raise ValueError(f"No valid domains provided. Must be from: {list(_GENERATORS.keys())}")
+
+    domain_salts = [(d, _DOMAIN_SEED_SALT[d]) for d in valid_domains]
 
-    documents = []
+    jobs = []
     for i in range(num_docs):
         # Pick domain and size
-        domain = rng.choice(valid_domains)
+        domain, salt = rng.choice(domain_salts)
         doc_size = rng.randint(min_size, max_size)
 
         # Generate unique seed for this document
-        doc_seed = seed + i * 1000 + hash(domain) % 1000
+        doc_seed = seed + i * 1000 + salt
+
+        jobs.append((domain, doc_seed, doc_size))
 
-        doc = generators[domain](doc_seed, doc_size)
-        documents.append(doc)
+    workers = min(workers or 1, num_docs)
+    if workers < 2 or num_docs < _PARALLEL_CORPUS_MIN_DOCS:
+        return [_generate_one(job) for job in jobs]
 
-    return documents
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(
+            executor.map(
+                _generate_one, jobs, chunksize=max(1, num_docs // (4 * workers))
+            )
+        )
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import hashlib
 import random
+from collections import Counter
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
@@ -120,13 +121,9 @@ def _manifest_to_dict(manifest: DataManifest) -> dict[str, Any]:
 
 def _compute_domain_distribution(manifest: DataManifest) -> dict[str, int]:
     """Compute count of documents per domain."""
-    distribution: dict[str, int] = {d: 0 for d in manifest.domains}
-    for doc_id in manifest.doc_ids:
-        # Extract domain from doc_id (format: domain_hexseed)
-        domain = doc_id.split("_")[0]
-        if domain in distribution:
-            distribution[domain] += 1
-    return distribution
+    # Domain is the doc_id prefix (format: domain_hexseed)
+    counts = Counter(doc_id.partition("_")[0] for doc_id in manifest.doc_ids)
+    return {d: counts[d] for d in manifest.domains}
 
 
 # Query generation templates
@@ -194,6 +191,17 @@ def _extract_topic_from_content(
     return f"topic_{rng.randint(1000, 9999)}"
 
 
+def _query_variations(base_query: str) -> list[str]:
+    """Return simple rephrasings of a query (case, politeness, wording)."""
+    return [
+        base_query.lower(),
+        base_query.upper(),
+        f"Please {base_query.lower()}",
+        f"{base_query.rstrip('?.')}?",
+        f"I need to {base_query.lower().replace('find', 'locate')}",
+    ]
+
+
 def generate_query_families(
     documents: list[SyntheticDocument],
     num_families: int,
@@ -253,20 +261,20 @@ def generate_query_families(
             query = template.format(topic=topic)
             queries.append(query)
 
-        # Add some simple variations
-        while len(queries) < reformulations_per_family:
-            base_query = rng.choice(queries[:len(used_templates)])
-            # Simple variations: add/remove words, change phrasing
-            variations = [
-                base_query.lower(),
-                base_query.upper(),
-                f"Please {base_query.lower()}",
-                f"{base_query.rstrip('?.')}?",
-                f"I need to {base_query.lower().replace('find', 'locate')}",
-            ]
-            new_query = rng.choice(variations)
-            if new_query not in queries:
-                queries.append(new_query)
+        # Add some simple variations, until none are left to add
+        if len(queries) < reformulations_per_family:
+            base_queries = queries[:len(used_templates)]
+            seen = set(queries)
+            remaining = {
+                v for q in base_queries for v in _query_variations(q)
+            } - seen
+            while len(queries) < reformulations_per_family and remaining:
+                base_query = rng.choice(base_queries)
+                new_query = rng.choice(_query_variations(base_query))
+                if new_query not in seen:
+                    queries.append(new_query)
+                    seen.add(new_query)
+                    remaining.discard(new_query)
 
         family = QueryFamily(
             family_id=f"family_{i:04d}",
@@ -306,7 +314,8 @@ def generate_anchors_manifest(documents: list[SyntheticDocument]) -> dict[str, A
     anchors = []
     for doc in documents:
         for start, end, anchor_id in doc.planted_anchors:
-            # Extract anchor content preview
+            # Extract anchor content preview (at most 100 bytes, so at most
+            # 100 characters)
             try:
                 preview = doc.content[start:min(end, start + 100)].decode("utf-8", errors="ignore")
             except Exception:
@@ -319,7 +328,7 @@ def generate_anchors_manifest(documents: list[SyntheticDocument]) -> dict[str, A
                 "start_offset": start,
                 "end_offset": end,
                 "length": end - start,
-                "preview": preview[:100] if len(preview) > 100 else preview,
+                "preview": preview,
             })
 
     return {
@@ -7,11 +7,18 @@ Provides deterministic, version-pinned embedding generation for curv-embedding.
 from __future__ import annotations
 
 import hashlib
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import numpy as np
 from sentence_transformers import SentenceTransformer
 
+# Inference backends EmbeddingModel can load the model with
+BACKENDS = ("torch", "onnx")
+
+# Weight/activation precisions for the PyTorch backend on CUDA
+PRECISIONS = ("fp32", "fp16", "bf16")
+
 if TYPE_CHECKING:
     from src.config import EmbeddingConfig
 
@@ -28,28 +35,118 @@ class EmbeddingModel:
         """
         Initialize the embedding model.
 
+        The default PyTorch backend reproduces the reference embeddings. The
+        ONNX backend, optionally with int8 dynamic quantization, is faster on
+        CPU but produces slightly different vectors, so it is opt-in and
+        reported by model_info(). Likewise, fp16/bf16 precision halves GPU
+        compute for the PyTorch backend at the cost of bitwise reproducibility.
+        All of these are read from the config, so the config hash records them.
+
         Args:
-            config: EmbeddingConfig with model_name, embedding_dim, batch_size, normalize.
+            config: EmbeddingConfig with model_name, embedding_dim, batch_size,
+                normalize and the inference options backend, quantization,
+                cache_dir, precision and num_threads.
+
+        Raises:
+            ValueError: If backend or precision is unknown, quantization is
+                requested without the ONNX backend, reduced precision is
+                requested with it, or num_threads is not positive.
         """
+        backend = config.backend
+        quantization = config.quantization
+        precision = config.precision
+        num_threads = config.num_threads
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}, expected one of {BACKENDS}")
+        if precision not in PRECISIONS:
+            raise ValueError(
+                f"Unknown precision {precision!r}, expected one of {PRECISIONS}"
+            )
+        if quantization is not None and backend != "onnx":
+            raise ValueError("quantization requires backend='onnx'")
+        if precision != "fp32" and backend != "torch":
+            raise ValueError("fp16/bf16 precision requires backend='torch'")
+        if num_threads is not None and num_threads < 1:
+            raise ValueError(f"num_threads must be positive, got {num_threads}")
+
         self._config = config
         self._model_name = config.model_name
         self._model_version = config.model_version
         self._embedding_dim = config.embedding_dim
         self._batch_size = config.batch_size
         self._normalize = config.normalize
+        self._backend = backend
+        self._quantization = quantization
+        self._num_threads = num_threads
 
-        # Load the model
-        self._model = SentenceTransformer(self._model_name)
+        if num_threads is not None:
+            import torch
 
-        # Verify embedding dimension matches expected
-        test_embedding = self._model.encode(["test"], convert_to_numpy=True)
-        actual_dim = test_embedding.shape[1]
+            torch.set_num_threads(num_threads)
+
+        # Load the model
+        if quantization is not None:
+            self._model = self._load_quantized_onnx(
+                quantization, Path(config.cache_dir)
+            )
+        elif backend == "onnx":
+            self._model = SentenceTransformer(self._model_name, backend="onnx")
+        else:
+            self._model = SentenceTransformer(self._model_name)
+
+        # Reduced precision only pays off (and is only well supported) on GPU
+        self._precision = "fp32"
+        if precision != "fp32" and self._model.device.type == "cuda":
+            if precision == "fp16":
+                self._model.half()
+            else:
+                self._model.bfloat16()
+            self._precision = precision
+
+        # Verify embedding dimension matches expected. The model reports it
+        # from its config when it can; otherwise probe with a forward pass
+        actual_dim = self._model.get_sentence_embedding_dimension()
+        if actual_dim is None:
+            test_embedding = self._model.encode(["test"], convert_to_numpy=True)
+            actual_dim = test_embedding.shape[1]
         if actual_dim != self._embedding_dim:
             raise ValueError(
                 f"Model {self._model_name} produces embeddings of dimension {actual_dim}, "
                 f"but config specifies {self._embedding_dim}"
             )
 
+    def _load_quantized_onnx(
+        self, quantization: str, cache_dir: Path
+    ) -> SentenceTransformer:
+        """
+        Load an int8 dynamically quantized ONNX export of the model.
+
+        Exports and quantizes the model into cache_dir on first use; later
+        loads reuse the exported file. Exports are kept per model name and
+        version, so bumping model_version never reuses a stale export.
+
+        Args:
+            quantization: sentence-transformers quantization target.
+            cache_dir: Directory holding exported models.
+
+        Returns:
+            SentenceTransformer running the quantized ONNX model.
+        """
+        from sentence_transformers import export_dynamic_quantized_onnx_model
+
+        export_dir = (
+            cache_dir / self._model_name.replace("/", "__") / self._model_version
+        )
+        file_name = f"onnx/model_qint8_{quantization}.onnx"
+        if not (export_dir / file_name).exists():
+            model = SentenceTransformer(self._model_name, backend="onnx")
+            model.save(str(export_dir))
+            export_dynamic_quantized_onnx_model(model, quantization, str(export_dir))
+
+        return SentenceTransformer(
+            str(export_dir), backend="onnx", model_kwargs={"file_name": file_name}
+        )
+
     def embed(self, texts: list[str]) -> np.ndarray:
         """
         Generate embeddings for a batch of texts.
@@ -63,7 +160,20 @@ class EmbeddingModel:
         if not texts:
             return np.array([], dtype=np.float32).reshape(0, self._embedding_dim)
 
-        embeddings = self._model.encode(
+        if self._precision == "fp32":
+            embeddings = self._encode(texts)
+        else:
+            import torch
+
+            with torch.inference_mode():
+                embeddings = self._encode(texts)
+
+        # encode() already returns float32, so this normally does not copy
+        return embeddings.astype(np.float32, copy=False)
+
+    def _encode(self, texts: list[str]) -> np.ndarray:
+        """Run the underlying model's encode() with the configured options."""
+        return self._model.encode(
             texts,
             batch_size=self._batch_size,
             convert_to_numpy=True,
@@ -71,8 +181,6 @@ class EmbeddingModel:
             show_progress_bar=False,
         )
 
-        return embeddings.astype(np.float32)
-
     def embed_single(self, text: str) -> np.ndarray:
         """
         Generate embedding for a single text.
@@ -91,7 +199,8 @@ class EmbeddingModel:
         Return model metadata.
 
         Returns:
-            Dictionary with model name, version, and embedding dimension.
+            Dictionary with model name, version, embedding dimension,
+            inference backend, precision and thread count.
         """
         return {
             "model_name": self._model_name,
@@ -99,6 +208,10 @@ class EmbeddingModel:
             "embedding_dim": self._embedding_dim,
             "normalize": self._normalize,
             "batch_size": self._batch_size,
+            "backend": self._backend,
+            "quantization": self._quantization,
+            "precision": self._precision,
+            "num_threads": self._num_threads,
         }
 
     @staticmethod
@@ -112,6 +225,31 @@ class EmbeddingModel:
         Returns:
             SHA256 hex digest of the embedding bytes.
         """
-        # Ensure consistent byte representation
-        embedding_bytes = embedding.astype(np.float32).tobytes()
+        # Hash float32 C-contiguous input in place; anything else is
+        # converted to the same float32 C-order bytes first
+        if embedding.dtype == np.float32 and embedding.flags["C_CONTIGUOUS"]:
+            embedding_bytes = memoryview(embedding).cast("B")
+        else:
+            embedding_bytes = np.ascontiguousarray(
+                embedding, dtype=np.float32
+            ).tobytes()
         return hashlib.sha256(embedding_bytes).hexdigest()
+
+    @staticmethod
+    def batch_checksum(vectors: np.ndarray) -> list[str]:
+        """
+        Compute SHA256 checksums for each row of a batch of embeddings.
+
+        Equivalent to calling embedding_checksum() on every row, but converts
+        the batch to float32 once and hashes row slices without copying.
+
+        Args:
+            vectors: np.ndarray of shape (n, dim).
+
+        Returns:
+            List of n SHA256 hex digests, one per row.
+        """
+        vectors_f32 = np.ascontiguousarray(vectors, dtype=np.float32)
+        # Rows of a C-contiguous array are contiguous views, which hashlib
+        # reads through the buffer protocol
+        return [hashlib.sha256(row).hexdigest() for row in vectors_f32]
@@ -26,13 +26,15 @@ def cosine_similarity(a: np.ndarray, b: np.ndarray) -> float:
     if a.shape != b.shape:
         raise ValueError(f"Vector dimensions must match: {a.shape} vs {b.shape}")
 
-    norm_a = np.linalg.norm(a)
-    norm_b = np.linalg.norm(b)
+    # Squared norms via vdot skip np.linalg.norm's dispatch; norm() computes
+    # sqrt(x.dot(x)) itself, so the result is unchanged
+    sq_norm_a = np.vdot(a, a)
+    sq_norm_b = np.vdot(b, b)
 
-    if norm_a == 0 or norm_b == 0:
+    if sq_norm_a == 0 or sq_norm_b == 0:
         raise ValueError("Cannot compute cosine similarity with zero vector")
 
-    return float(np.dot(a, b) / (norm_a * norm_b))
+    return float(np.dot(a, b) / (np.sqrt(sq_norm_a) * np.sqrt(sq_norm_b)))
 
 
 def l2_distance(a: np.ndarray, b: np.ndarray) -> float:
@@ -52,7 +54,8 @@ def l2_distance(a: np.ndarray, b: np.ndarray) -> float:
     if a.shape != b.shape:
         raise ValueError(f"Vector dimensions must match: {a.shape} vs {b.shape}")
 
-    return float(np.linalg.norm(a - b))
+    diff = a - b
+    return float(np.sqrt(np.vdot(diff, diff)))
 
 
 def normalize_vectors(vectors: np.ndarray) -> np.ndarray:
@@ -73,10 +76,20 @@ def normalize_vectors(vectors: np.ndarray) -> np.ndarray:
         return vectors / norm
 
     # Handle 2D case
-    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    if not np.issubdtype(vectors.dtype, np.floating):
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        # Avoid division by zero for zero vectors
+        norms = np.where(norms == 0, 1, norms)
+        return vectors / norms
+
+    # Same arithmetic as np.linalg.norm (sum of squares, then sqrt), but the
+    # squares buffer is reused for the output instead of allocating a second
+    # full-size array
+    out = np.multiply(vectors, vectors)
+    norms = np.sqrt(np.add.reduce(out, axis=1, keepdims=True))
     # Avoid division by zero for zero vectors
-    norms = np.where(norms == 0, 1, norms)
-    return vectors / norms
+    norms[norms == 0] = 1
+    return np.divide(vectors, norms, out=out)
 
 
 def vectors_to_bytes(vectors: np.ndarray) -> bytes:
@@ -91,18 +104,45 @@ def vectors_to_bytes(vectors: np.ndarray) -> bytes:
     Returns:
         Bytes representation of the vectors.
     """
-    # Ensure consistent dtype and byte order
-    vectors_f32 = vectors.astype(np.float32)
+    # Ensure consistent dtype and byte order; a no-op for float32 C-order
+    # input, so tobytes() is the only copy
+    vectors_f32 = np.ascontiguousarray(vectors, dtype=np.float32)
     return vectors_f32.tobytes()
 
 
-def bytes_to_vectors(data: bytes, dim: int) -> np.ndarray:
+def vectors_to_memoryview(vectors: np.ndarray) -> memoryview:
+    """
+    Expose vectors as a flat float32 buffer without copying when possible.
+
+    The buffer holds the same bytes as vectors_to_bytes(), but float32
+    C-contiguous input is shared rather than copied. Use it for consumers
+    that accept any buffer (hashlib, file writes, sockets).
+
+    Args:
+        vectors: np.ndarray of any shape.
+
+    Returns:
+        Read-only byte-format memoryview over the float32 data.
+    """
+    vectors_f32 = np.ascontiguousarray(vectors, dtype=np.float32)
+    return memoryview(vectors_f32.reshape(-1).view(np.uint8)).toreadonly()
+
+
+def bytes_to_vectors(
+    data: bytes | bytearray, dim: int, writable: bool = False
+) -> np.ndarray:
     """
     Deserialize bytes back to vectors.
 
+    The result is a view over ``data`` and is read-only for ``bytes`` input.
+    With ``writable=True`` a writable buffer (e.g. ``bytearray``) is viewed
+    in place, and a read-only one is copied once so the result supports
+    in-place operations.
+
     Args:
         data: Bytes from vectors_to_bytes().
         dim: Embedding dimension to reshape vectors.
+        writable: Whether the returned array must be writable.
 
     Returns:
         np.ndarray of shape (n, dim) where n = len(data) / (4 * dim).
@@ -110,12 +150,131 @@ def bytes_to_vectors(data: bytes, dim: int) -> np.ndarray:
     Raises:
         ValueError: If data length is not divisible by (4 * dim).
     """
-    if len(data) % (4 * dim) != 0:
+    n_vectors, remainder = divmod(len(data), 4 * dim)
+    if remainder != 0:
         raise ValueError(
             f"Data length {len(data)} not divisible by {4 * dim} "
             f"(4 bytes per float32 * {dim} dimensions)"
         )
 
-    vectors = np.frombuffer(data, dtype=np.float32)
-    n_vectors = len(vectors) // dim
+    if writable and memoryview(data).readonly:
+        data = bytearray(data)
+    vectors = np.frombuffer(data, dtype=np.float32, count=n_vectors * dim)
     return vectors.reshape(n_vectors, dim)
+
+
+def quantize_int8(vectors: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Quantize vectors to int8 with one symmetric scale per vector.
+
+    Each row is divided by ``max(abs(row)) / 127`` and rounded, so
+    ``q * scale`` approximates the original row to within half a step.
+
+    Args:
+        vectors: np.ndarray of shape (n, dim).
+
+    Returns:
+        Tuple of (q, scales): int8 array of shape (n, dim) and float32
+        array of shape (n,). Zero vectors get scale 0.0 and all-zero q.
+    """
+    vectors_f32 = np.asarray(vectors, dtype=np.float32)
+    scales = np.abs(vectors_f32).max(axis=1) / np.float32(127.0)
+    # Avoid division by zero for zero vectors
+    safe_scales = np.where(scales == 0, np.float32(1.0), scales)
+    q = np.round(vectors_f32 / safe_scales[:, None]).astype(np.int8)
+    return q, scales.astype(np.float32)
+
+
+def dequantize_int8(q: np.ndarray, scales: np.ndarray) -> np.ndarray:
+    """
+    Reconstruct float32 vectors from quantize_int8() output.
+
+    Args:
+        q: int8 array of shape (n, dim).
+        scales: float32 array of shape (n,).
+
+    Returns:
+        float32 array of shape (n, dim).
+    """
+    return q.astype(np.float32) * np.asarray(scales, dtype=np.float32)[:, None]
+
+
+def cosine_similarity_int8(qa: np.ndarray, qb: np.ndarray) -> float:
+    """
+    Compute cosine similarity between two int8-quantized vectors.
+
+    Per-vector scales cancel out of the cosine, so only the integer
+    payloads are needed. Products are accumulated in int64.
+
+    Args:
+        qa: First quantized vector (1D int8 array).
+        qb: Second quantized vector (1D int8 array).
+
+    Returns:
+        Cosine similarity of the dequantized vectors as a float in [-1, 1].
+
+    Raises:
+        ValueError: If vectors have different dimensions or are zero vectors.
+    """
+    if qa.shape != qb.shape:
+        raise ValueError(f"Vector dimensions must match: {qa.shape} vs {qb.shape}")
+
+    a = qa.astype(np.int64)
+    b = qb.astype(np.int64)
+    sq_norm_a = int(np.dot(a, a))
+    sq_norm_b = int(np.dot(b, b))
+
+    if sq_norm_a == 0 or sq_norm_b == 0:
+        raise ValueError("Cannot compute cosine similarity with zero vector")
+
+    return float(int(np.dot(a, b)) / (np.sqrt(sq_norm_a) * np.sqrt(sq_norm_b)))
+
+
+def _int8_record_dtype(dim: int) -> np.dtype:
+    """Return the serialized layout of one quantized vector."""
+    return np.dtype([("scale", "<f4"), ("q", "i1", (dim,))])
+
+
+def vectors_to_bytes_int8(q: np.ndarray, scales: np.ndarray) -> bytes:
+    """
+    Serialize int8-quantized vectors to bytes.
+
+    Each vector is stored as its little-endian float32 scale followed by
+    its dim int8 values, a quarter of the float32 size for typical dims.
+
+    Args:
+        q: int8 array of shape (n, dim) from quantize_int8().
+        scales: float32 array of shape (n,) from quantize_int8().
+
+    Returns:
+        Bytes representation of the quantized vectors.
+    """
+    records = np.empty(len(q), dtype=_int8_record_dtype(q.shape[1]))
+    records["scale"] = scales
+    records["q"] = q
+    return records.tobytes()
+
+
+def bytes_to_vectors_int8(data: bytes, dim: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Deserialize bytes from vectors_to_bytes_int8().
+
+    Args:
+        data: Bytes from vectors_to_bytes_int8().
+        dim: Embedding dimension.
+
+    Returns:
+        Tuple of (q, scales) as returned by quantize_int8().
+
+    Raises:
+        ValueError: If data length is not divisible by (4 + dim).
+    """
+    record_dtype = _int8_record_dtype(dim)
+    if len(data) % record_dtype.itemsize != 0:
+        raise ValueError(
+            f"Data length {len(data)} not divisible by {record_dtype.itemsize} "
+            f"(4-byte float32 scale + {dim} int8 values)"
+        )
+
+    records = np.frombuffer(data, dtype=record_dtype)
+    return records["q"].copy(), records["scale"].astype(np.float32)
@@ -17,7 +17,6 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 import numpy as np
-from scipy import stats
 
 if TYPE_CHECKING:
     from numpy.typing import NDArray
@@ -42,6 +41,26 @@ def compute_topk_overlap(
     Returns:
         Overlap ratio in range [0, 1].
 
+    Raises:
+        ValueError: If k is non-positive or lists are shorter than k.
+    """
+    _check_topk_lengths(old_neighbors, new_neighbors, k)
+
+    old_set = set(old_neighbors[:k])
+    new_set = set(new_neighbors[:k])
+
+    intersection_size = len(old_set & new_set)
+    return intersection_size / k
+
+
+def _check_topk_lengths(
+    old_neighbors: list[str],
+    new_neighbors: list[str],
+    k: int,
+) -> None:
+    """
+    Validate that k is positive and both neighbor lists hold at least k items.
+
     Raises:
         ValueError: If k is non-positive or lists are shorter than k.
     """
@@ -57,12 +76,6 @@ def compute_topk_overlap(
             f"new_neighbors has {len(new_neighbors)} items, need at least {k}"
         )
 
-    old_set = set(old_neighbors[:k])
-    new_set = set(new_neighbors[:k])
-
-    intersection_size = len(old_set & new_set)
-    return intersection_size / k
-
 
 def compute_jaccard(
     old_neighbors: list[str],
@@ -116,26 +129,68 @@ def compute_rank_correlation(
     old_ranks = {neighbor: rank + 1 for rank, neighbor in enumerate(old_neighbors)}
     new_ranks = {neighbor: rank + 1 for rank, neighbor in enumerate(new_neighbors)}
 
-    # Find shared neighbors
-    shared = set(old_ranks.keys()) & set(new_ranks.keys())
-
-    if len(shared) < 2:
+    # New ranks of shared neighbors ordered by old rank. Both rank maps are
+    # injective, so neither sequence has ties and tau-b reduces to
+    # (concordant - discordant) / total pairs. Without duplicate IDs the old
+    # list is already in rank order; otherwise a repeated ID takes its last
+    # rank and the shared IDs must be sorted explicitly.
+    if len(old_ranks) == len(old_neighbors):
+        new_rank_values = [new_ranks[n] for n in old_neighbors if n in new_ranks]
+    else:
+        shared = old_ranks.keys() & new_ranks.keys()
+        new_rank_values = [
+            new_ranks[n] for n in sorted(shared, key=old_ranks.__getitem__)
+        ]
+
+    if len(new_rank_values) < 2:
         # Correlation undefined with fewer than 2 points
         return 0.0
 
-    # Extract ranks for shared neighbors in deterministic order
-    shared_sorted = sorted(shared)
-    old_rank_values = [old_ranks[n] for n in shared_sorted]
-    new_rank_values = [new_ranks[n] for n in shared_sorted]
+    size = len(new_rank_values)
+    tot = size * (size - 1) // 2
+    dis = _count_inversions(new_rank_values)
 
-    # Compute Kendall tau-b (handles ties correctly)
-    tau, _ = stats.kendalltau(old_rank_values, new_rank_values)
+    # Same arithmetic as scipy.stats.kendalltau (variant "b") for tie-free
+    # input, so results are bit-identical to the previous implementation.
+    tau = (tot - 2 * dis) / np.sqrt(tot) / np.sqrt(tot)
+    return float(min(1.0, max(-1.0, tau)))
 
-    # Handle NaN case (can occur with constant ranks)
-    if np.isnan(tau):
-        return 0.0
 
-    return float(tau)
+def _count_inversions(values: list[int]) -> int:
+    """
+    Count pairs i < j with values[i] > values[j] via bottom-up merge sort.
+
+    Args:
+        values: Sequence of distinct integers.
+
+    Returns:
+        Number of inversions (discordant pairs against the sorted order).
+    """
+    runs = list(values)
+    size = len(runs)
+    inversions = 0
+    width = 1
+    while width < size:
+        merged: list[int] = []
+        for lo in range(0, size, 2 * width):
+            left = runs[lo : lo + width]
+            right = runs[lo + width : lo + 2 * width]
+            i = j = 0
+            n_left = len(left)
+            n_right = len(right)
+            while i < n_left and j < n_right:
+                if left[i] <= right[j]:
+                    merged.append(left[i])
+                    i += 1
+                else:
+                    merged.append(right[j])
+                    inversions += n_left - i
+                    j += 1
+            merged.extend(left[i:])
+            merged.extend(right[j:])
+        runs = merged
+        width *= 2
+    return inversions
 
 
 @dataclass
@@ -227,8 +282,15 @@ def compute_churn_stats(
     for old_neighbors, new_neighbors in zip(
         old_neighbor_lists, new_neighbor_lists, strict=True
     ):
-        overlaps.append(compute_topk_overlap(old_neighbors, new_neighbors, k))
-        jaccards.append(compute_jaccard(old_neighbors[:k], new_neighbors[:k]))
+        # Top-k overlap and Jaccard share the same top-k sets, so build them
+        # once per query instead of once per metric.
+        _check_topk_lengths(old_neighbors, new_neighbors, k)
+        old_set = set(old_neighbors[:k])
+        new_set = set(new_neighbors[:k])
+        intersection_size = len(old_set & new_set)
+        overlaps.append(intersection_size / k)
+        union_size = len(old_set) + len(new_set) - intersection_size
+        jaccards.append(intersection_size / union_size)
         rank_correlations.append(compute_rank_correlation(old_neighbors, new_neighbors))
 
     overlap_arr = np.array(overlaps, dtype=np.float64)
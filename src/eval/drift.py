@@ -20,7 +20,11 @@ if TYPE_CHECKING:
     from numpy.typing import NDArray
 
 
-def compute_drift_cosine(e_old: NDArray[np.floating], e_new: NDArray[np.floating]) -> float:
+def compute_drift_cosine(
+    e_old: NDArray[np.floating],
+    e_new: NDArray[np.floating],
+    assume_normalized: bool = False,
+) -> float:
     """
     Compute cosine drift between two embedding vectors.
 
@@ -32,12 +36,17 @@ def compute_drift_cosine(e_old: NDArray[np.floating], e_new: NDArray[np.floating
     Args:
         e_old: Old embedding vector (1D array).
         e_new: New embedding vector (1D array), same dimension as e_old.
+        assume_normalized: Treat both vectors as unit length and use their
+            dot product directly, skipping the norm computation. Only valid
+            for L2-normalized embeddings; results differ from the default in
+            the last bits because stored norms are only approximately 1.
 
     Returns:
         Cosine drift value in range [0, 2].
 
     Raises:
-        ValueError: If vectors have different shapes or zero norm.
+        ValueError: If vectors have different shapes or zero norm (the norm
+            check is skipped when assume_normalized is set).
     """
     e_old = np.asarray(e_old, dtype=np.float64)
     e_new = np.asarray(e_new, dtype=np.float64)
@@ -50,13 +59,20 @@ def compute_drift_cosine(e_old: NDArray[np.floating], e_new: NDArray[np.floating
     if e_old.ndim != 1:
         raise ValueError(f"Expected 1D arrays, got shape {e_old.shape}")
 
-    norm_old = np.linalg.norm(e_old)
-    norm_new = np.linalg.norm(e_new)
+    if assume_normalized:
+        cosine_sim = np.dot(e_old, e_new)
+    else:
+        # Same values as np.linalg.norm (sqrt of the self dot product) with
+        # less per-call overhead
+        sq_norm_old = np.vdot(e_old, e_old)
+        sq_norm_new = np.vdot(e_new, e_new)
 
-    if norm_old == 0 or norm_new == 0:
-        raise ValueError("Cannot compute cosine similarity for zero-norm vectors")
+        if sq_norm_old == 0 or sq_norm_new == 0:
+            raise ValueError("Cannot compute cosine similarity for zero-norm vectors")
 
-    cosine_sim = np.dot(e_old, e_new) / (norm_old * norm_new)
+        cosine_sim = np.dot(e_old, e_new) / (
+            np.sqrt(sq_norm_old) * np.sqrt(sq_norm_new)
+        )
     # Clip to handle floating point errors that could put us slightly outside [-1, 1]
     cosine_sim = np.clip(cosine_sim, -1.0, 1.0)
 
@@ -88,7 +104,8 @@ def compute_drift_l2(e_old: NDArray[np.floating], e_new: NDArray[np.floating]) -
     if e_old.ndim != 1:
         raise ValueError(f"Expected 1D arrays, got shape {e_old.shape}")
 
-    return float(np.linalg.norm(e_old - e_new))
+    diff = e_old - e_new
+    return float(np.sqrt(np.vdot(diff, diff)))
 
 
 @dataclass
@@ -138,9 +155,78 @@ class DriftResult:
         }
 
 
+def _row_dots(a: NDArray[np.float64], b: NDArray[np.float64]) -> NDArray[np.float64]:
+    """
+    Compute the dot product of each row of a with the same row of b.
+
+    Uses a stacked matmul of (1, dim) by (dim, 1) products, which NumPy
+    evaluates with the same BLAS dot as np.dot on each pair of rows, so
+    every value matches the per-pair result exactly (np.einsum and
+    (a * b).sum(axis=1) sum in a different order).
+
+    Args:
+        a: Array of shape (n, dim).
+        b: Array of shape (n, dim).
+
+    Returns:
+        Array of shape (n,) with the row-wise dot products.
+    """
+    return np.matmul(a[:, np.newaxis, :], b[:, :, np.newaxis])[:, 0, 0]
+
+
+def _batched_drift(
+    old_vectors: list[NDArray[np.floating]],
+    new_vectors: list[NDArray[np.floating]],
+    assume_normalized: bool = False,
+) -> tuple[NDArray[np.float64], NDArray[np.float64]] | None:
+    """
+    Compute cosine and L2 drift for all matched pairs at once.
+
+    Applies the same float64 operations as compute_drift_cosine() and
+    compute_drift_l2() to every pair in one pass.
+
+    Args:
+        old_vectors: Old embedding vectors.
+        new_vectors: New embedding vectors, paired by index with old_vectors.
+        assume_normalized: Skip norms for cosine drift, as in
+            compute_drift_cosine().
+
+    Returns:
+        Tuple of (cosine drifts, L2 drifts), or None if the pairs are not all
+        1D vectors of one shape with nonzero norms, so that the per-pair
+        functions can report the offending pair.
+    """
+    try:
+        e_old = np.array(old_vectors, dtype=np.float64)
+        e_new = np.array(new_vectors, dtype=np.float64)
+    except ValueError:  # Ragged: vectors of different lengths
+        return None
+    if e_old.ndim != 2 or e_old.shape != e_new.shape:
+        return None
+
+    if assume_normalized:
+        cosine_sim = _row_dots(e_old, e_new)
+    else:
+        sq_norm_old = _row_dots(e_old, e_old)
+        sq_norm_new = _row_dots(e_new, e_new)
+        if not (np.all(sq_norm_old != 0) and np.all(sq_norm_new != 0)):
+            return None
+
+        cosine_sim = _row_dots(e_old, e_new) / (
+            np.sqrt(sq_norm_old) * np.sqrt(sq_norm_new)
+        )
+    cosine_arr = 1.0 - np.clip(cosine_sim, -1.0, 1.0)
+
+    diff = e_old - e_new
+    l2_arr = np.sqrt(_row_dots(diff, diff))
+
+    return cosine_arr, l2_arr
+
+
 def compute_drift_stats(
     old_embeddings: dict[str, NDArray[np.floating]],
     new_embeddings: dict[str, NDArray[np.floating]],
+    assume_normalized: bool = False,
 ) -> DriftResult:
     """
     Compute drift statistics for embeddings matched by content SHA256.
@@ -151,6 +237,8 @@ def compute_drift_stats(
     Args:
         old_embeddings: Dict mapping content_sha256 -> embedding vector (old model).
         new_embeddings: Dict mapping content_sha256 -> embedding vector (new model).
+        assume_normalized: Both sets hold L2-normalized embeddings (e.g.
+            EmbeddingConfig.normalize); see compute_drift_cosine().
 
     Returns:
         DriftResult with aggregated statistics.
@@ -166,19 +254,30 @@ def compute_drift_stats(
     if not matched_keys:
         raise ValueError("No matching content hashes found between old and new embeddings")
 
-    # Compute drift for each matched pair
-    cosine_drifts: list[float] = []
-    l2_drifts: list[float] = []
-
-    for key in sorted(matched_keys):  # Sort for determinism
-        e_old = old_embeddings[key]
-        e_new = new_embeddings[key]
-
-        cosine_drifts.append(compute_drift_cosine(e_old, e_new))
-        l2_drifts.append(compute_drift_l2(e_old, e_new))
-
-    cosine_arr = np.array(cosine_drifts, dtype=np.float64)
-    l2_arr = np.array(l2_drifts, dtype=np.float64)
+    keys = sorted(matched_keys)  # Sort for determinism
+    batched = _batched_drift(
+        [old_embeddings[key] for key in keys],
+        [new_embeddings[key] for key in keys],
+        assume_normalized,
+    )
+    if batched is not None:
+        cosine_arr, l2_arr = batched
+    else:
+        # Compute drift for each matched pair; raises for the first invalid one
+        cosine_drifts: list[float] = []
+        l2_drifts: list[float] = []
+
+        for key in keys:
+            e_old = old_embeddings[key]
+            e_new = new_embeddings[key]
+
+            cosine_drifts.append(
+                compute_drift_cosine(e_old, e_new, assume_normalized)
+            )
+            l2_drifts.append(compute_drift_l2(e_old, e_new))
+
+        cosine_arr = np.array(cosine_drifts, dtype=np.float64)
+        l2_arr = np.array(l2_drifts, dtype=np.float64)
 
     return DriftResult(
         mean_cosine=float(np.mean(cosine_arr)),
@@ -15,6 +15,10 @@ Metrics:
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
 
 @dataclass
@@ -91,17 +95,13 @@ def compute_maintenance_stats(
     Returns:
         MaintenanceResult with computed statistics.
     """
-    # Set operations
-    unchanged = old_chunks & new_chunks
-    added = new_chunks - old_chunks
-    removed = old_chunks - new_chunks
-
-    unchanged_count = len(unchanged)
-    added_count = len(added)
-    removed_count = len(removed)
-
+    # Only the sizes of the set differences are needed, and both follow
+    # from the intersection size
     total_old = len(old_chunks)
     total_new = len(new_chunks)
+    unchanged_count = len(old_chunks & new_chunks)
+    added_count = total_new - unchanged_count
+    removed_count = total_old - unchanged_count
 
     # Determine denominator for reembed fraction
     if total_chunks is None:
@@ -145,7 +145,7 @@ def compute_maintenance_stats(
 
 
 def compute_cumulative_maintenance(
-    chunk_versions: list[set[str]],
+    chunk_versions: Iterable[set[str]],
     tombstone_threshold: float = 0.2,
 ) -> list[MaintenanceResult]:
     """
@@ -155,8 +155,9 @@ def compute_cumulative_maintenance(
     multiple revisions.
 
     Args:
-        chunk_versions: List of chunk sets (by content SHA256) for each version.
-            Must have at least 2 versions.
+        chunk_versions: Chunk sets (by content SHA256) for each version, as a
+            list or any iterable (e.g. a generator loading one version at a
+            time). Must have at least 2 versions.
         tombstone_threshold: Fraction of tombstones that triggers rebuild.
 
     Returns:
@@ -165,16 +166,14 @@ def compute_cumulative_maintenance(
     Raises:
         ValueError: If fewer than 2 versions provided.
     """
-    if len(chunk_versions) < 2:
-        raise ValueError("Need at least 2 versions to compute maintenance stats")
-
     results: list[MaintenanceResult] = []
     cumulative_tombstones = 0
 
-    for i in range(1, len(chunk_versions)):
-        old_chunks = chunk_versions[i - 1]
-        new_chunks = chunk_versions[i]
+    # Stream over versions, keeping only the previous one alive
+    versions = iter(chunk_versions)
+    old_chunks = next(versions, None)
 
+    for new_chunks in versions:
         result = compute_maintenance_stats(
             old_chunks=old_chunks,
             new_chunks=new_chunks,
@@ -191,6 +190,11 @@ def compute_cumulative_maintenance(
         else:
             cumulative_tombstones = result.tombstone_count
 
+        old_chunks = new_chunks
+
+    if not results:
+        raise ValueError("Need at least 2 versions to compute maintenance stats")
+
     return results
 
 